@@ -0,0 +1,11 @@
+"""
+pytest 根配置
+
+位于项目根目录，pytest 会在收集阶段一次性将根目录加入 sys.path，
+测试模块可直接 `from src...` 导入，无需各自修改 sys.path。
+"""
+
+
+def pytest_configure(config):
+    """注册自定义标记"""
+    config.addinivalue_line("markers", "perf: 性能测试（耗时较长，可用 -m \"not perf\" 跳过）")
@@ -5,6 +5,7 @@ i18n-assistant GUI应用启动器
 专门用于启动GUI界面的脚本
 """
 
+import multiprocessing
 import sys
 import os
 
@@ -27,4 +28,6 @@ def main():
         return 1
 
 if __name__ == "__main__":
+    # 打包后的可执行文件中，扫描使用的工作进程需要由此进入
+    multiprocessing.freeze_support()
     sys.exit(main()) 
\ No newline at end of file
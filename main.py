@@ -7,6 +7,7 @@ i18n-assistant 主程序入口
 - 使用 --cli 参数启动命令行模式
 """
 
+import multiprocessing
 import sys
 import os
 import argparse
@@ -92,4 +93,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # 打包后的可执行文件中，扫描使用的工作进程需要由此进入
+    multiprocessing.freeze_support()
     sys.exit(main())
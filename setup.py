@@ -44,6 +44,8 @@ dev_requirements = [
     'pytest-qt>=4.2.0',
     'pytest-cov>=4.0.0',
     'pytest-mock>=3.12.0',
+    'pytest-benchmark>=4.0.0',
+    'pytest-xdist>=3.5.0',
     'black>=24.3.0',
     'flake8>=6.1.0',
     'mypy>=1.7.0',
@@ -59,6 +61,12 @@ gui_requirements = [
     'PySide6>=6.5.0,<6.8.0',  # 备选GUI框架
 ]
 
+# 性能加速依赖（可选，缺失时自动回退到标准库实现）
+speedup_requirements = [
+    'pyahocorasick>=2.0.0',
+    'orjson>=3.9.0',
+]
+
 setup(
     name="i18n-assistant",
     version=get_version(),
@@ -89,7 +97,8 @@ setup(
     extras_require={
         'dev': dev_requirements,
         'gui': gui_requirements,
-        'all': dev_requirements + gui_requirements,
+        'speedups': speedup_requirements,
+        'all': dev_requirements + gui_requirements + speedup_requirements,
     },
     entry_points={
         'console_scripts': [
@@ -2,33 +2,48 @@
 分析引擎模块 - 对比项目使用情况和国际化文件，生成分析结果
 """
 
+import sys
 from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Dict, List, Set, Any, Optional
+from typing import Dict, List, Set, Any, Optional, Tuple
 
 from .parser import ParseResult
 from .scanner import I18nCall
 
+# 与 scanner 模块相同，Python 3.10+ 时为分析结果中的大量键对象启用 __slots__
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class MissingKey:
     """缺失的国际化键"""
     key: str
     file_path: str
     line_number: int
     column_number: int
-    suggested_files: List[str] = field(default_factory=list)
+    suggested_files: Tuple[str, ...] = ()
 
+    def __post_init__(self):
+        """驻留键字符串，建议文件转换为元组（传入元组时直接共享同一对象）"""
+        if isinstance(self.key, str):
+            self.key = sys.intern(self.key)
+        self.suggested_files = tuple(self.suggested_files)
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class UnusedKey:
     """未使用的国际化键"""
     key: str
     i18n_file: str
     value: Any = None
 
+    def __post_init__(self):
+        """驻留键字符串"""
+        if isinstance(self.key, str):
+            self.key = sys.intern(self.key)
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class InconsistentKey:
     """不一致的国际化键"""
     key: str
@@ -36,7 +51,7 @@ class InconsistentKey:
     missing_files: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class VariableInterpolationCall:
     """包含变量插值的国际化调用"""
     key: str
@@ -222,6 +237,12 @@ class AnalysisEngine:
 
                 # Create mock parse_result
                 parse_result = type('MockParseResult', (), {'all_keys': all_keys, 'keys_by_file': keys_by_file})()
+        elif isinstance(parse_result, ParseResult):
+            # total_keys 在解析阶段已合并为只读集合，直接参与集合差运算
+            defined_keys = parse_result.total_keys
+        elif hasattr(parse_result, 'keys_by_file'):
+            # 直接合并各文件的键集合，无需为每个键提取值来构建 all_keys
+            defined_keys = set().union(*parse_result.keys_by_file.values())
         else:
             defined_keys = set(parse_result.all_keys.keys())
 
@@ -320,12 +341,12 @@ class AnalysisEngine:
         # 用于按文件统计缺失键
         missing_keys_by_file = defaultdict(list)
 
+        # 建议可能的i18n文件（与具体的键无关，只需计算一次）
+        suggested_files = tuple(self._suggest_i18n_files(parse_result)) if missing_key_names else ()
+
         for key in missing_key_names:
             calls = used_keys_detail[key]
             for call in calls:
-                # 建议可能的i18n文件
-                suggested_files = self._suggest_i18n_files(key, parse_result)
-
                 missing_key = MissingKey(key=key, file_path=call.file_path, line_number=call.line_number,
                                          column_number=call.column_number, suggested_files=suggested_files)
                 missing_keys.append(missing_key)
@@ -344,7 +365,7 @@ class AnalysisEngine:
         unused_key_names = defined_keys - used_keys
 
         # Handle different types of parse_result
-        if hasattr(parse_result, 'keys_by_file'):
+        if unused_key_names and hasattr(parse_result, 'keys_by_file'):
             keys_by_file = parse_result.keys_by_file
             all_keys = parse_result.all_keys
         else:
@@ -354,16 +375,17 @@ class AnalysisEngine:
         # 用于按文件统计未使用键
         unused_keys_by_file = {}
 
-        # 遍历每个文件，找出每个文件中的未使用键
-        for file_path, keys_data in keys_by_file.items():
+        # 每个文件的未使用键即其键集合与未使用键集合的交集
+        unused_names_by_file = {file_path: unused_key_names.intersection(keys_data) for file_path, keys_data in
+                                keys_by_file.items()}
+
+        for file_path, file_unused_names in unused_names_by_file.items():
             file_unused_keys = []
 
-            # 找出此文件中的未使用键
-            for key in keys_data:
-                if key in unused_key_names:
-                    unused_key = UnusedKey(key=key, i18n_file=file_path, value=all_keys.get(key))
-                    unused_keys.append(unused_key)
-                    file_unused_keys.append(unused_key)
+            for key in file_unused_names:
+                unused_key = UnusedKey(key=key, i18n_file=file_path, value=all_keys.get(key))
+                unused_keys.append(unused_key)
+                file_unused_keys.append(unused_key)
 
             # 只有当文件有未使用键时才添加到统计中
             if file_unused_keys:
@@ -387,14 +409,12 @@ class AnalysisEngine:
         if len(keys_by_file) <= 1:
             return inconsistent_keys
 
-        # 获取所有文件的键集合
-        all_files = list(keys_by_file.keys())
-        all_unique_keys = set()
-        for keys_set in keys_by_file.values():
-            all_unique_keys.update(keys_set)
+        # 获取所有文件的键集合：并集减去交集即为不一致的键
+        all_unique_keys = set().union(*keys_by_file.values())
+        common_keys = set.intersection(*(set(keys_set) for keys_set in keys_by_file.values()))
 
-        # 检查每个键在所有文件中的存在情况
-        for key in all_unique_keys:
+        # 只对不一致的键检查其在各文件中的存在情况
+        for key in all_unique_keys - common_keys:
             existing_files = []
             missing_files = []
 
@@ -404,10 +424,8 @@ class AnalysisEngine:
                 else:
                     missing_files.append(file_path)
 
-            # 如果键在某些文件中存在，在某些文件中不存在，则认为不一致
-            if missing_files:
-                inconsistent_key = InconsistentKey(key=key, existing_files=existing_files, missing_files=missing_files)
-                inconsistent_keys.append(inconsistent_key)
+            inconsistent_key = InconsistentKey(key=key, existing_files=existing_files, missing_files=missing_files)
+            inconsistent_keys.append(inconsistent_key)
 
         return inconsistent_keys
 
@@ -487,7 +505,7 @@ class AnalysisEngine:
 
         return result
 
-    def _suggest_i18n_files(self, key: str, parse_result) -> List[str]:
+    def _suggest_i18n_files(self, parse_result) -> List[str]:
         """建议可能的i18n文件"""
         suggestions = []
 
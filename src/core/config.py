@@ -4,10 +4,12 @@
 提供配置数据结构定义、配置文件读写、配置验证等功能。
 """
 
+import copy
 import json
 import logging
 import os
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 
 from ..utils.pattern_utils import get_default_i18n_patterns
@@ -15,6 +17,25 @@ from ..utils.pattern_utils import get_default_i18n_patterns
 logger = logging.getLogger(__name__)
 
 
+def _abspath(path: str) -> str:
+    """
+    转换为绝对路径，结果按(当前工作目录, 路径)缓存
+
+    Args:
+        path: 路径字符串（不接受Path对象）
+
+    Returns:
+        str: 绝对路径，空字符串原样返回
+    """
+    return _abspath_in(os.getcwd(), path) if path else path
+
+
+@lru_cache(maxsize=1024)
+def _abspath_in(cwd: str, path: str) -> str:
+    """相对路径的解析依赖当前工作目录，因此工作目录作为缓存键的一部分"""
+    return os.path.abspath(path)
+
+
 @dataclass
 class Config:
     """配置数据结构"""
@@ -27,16 +48,16 @@ class Config:
         """配置初始化后处理"""
         # 如果output_path为空，设置默认值并转换为绝对路径
         if not self.output_path:
-            self.output_path = os.path.abspath("./i18n-analysis")
+            self.output_path = _abspath("./i18n-analysis")
         else:
             # 确保现有路径也是绝对路径
-            self.output_path = os.path.abspath(self.output_path)
+            self.output_path = _abspath(self.output_path)
 
         # 确保其他路径也是绝对路径
         if self.project_path:
-            self.project_path = os.path.abspath(self.project_path)
+            self.project_path = _abspath(self.project_path)
         if self.i18n_path:
-            self.i18n_path = os.path.abspath(self.i18n_path)
+            self.i18n_path = _abspath(self.i18n_path)
 
     # 忽略模式配置
     ignore_patterns: List[str] = field(
@@ -96,11 +117,11 @@ class ConfigManager:
             return self.config
 
         try:
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
+            stat = os.stat(self.config_file)
+            config_data = self._load_config_data(os.path.abspath(self.config_file), stat.st_mtime_ns, stat.st_size)
 
-            # 合并配置数据
-            self._merge_config(config_data)
+            # 合并配置数据（深拷贝，避免配置对象与缓存共享可变列表）
+            self._merge_config(copy.deepcopy(config_data))
             logger.info(f"成功加载配置文件: {self.config_file}")
 
         except Exception as e:
@@ -109,6 +130,25 @@ class ConfigManager:
 
         return self.config
 
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _load_config_data(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+        """
+        读取并解析配置文件，结果按 (路径, 修改时间, 大小) 缓存
+
+        文件未变化时重复加载直接复用解析结果，文件被修改后缓存键随之变化。
+
+        Args:
+            path: 配置文件绝对路径
+            mtime_ns: 文件修改时间（纳秒）
+            size: 文件大小
+
+        Returns:
+            Dict[str, Any]: 配置数据字典
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
     def save_config(self, config_file: Optional[str] = None) -> bool:
         """
         保存配置到文件
@@ -134,6 +174,9 @@ class ConfigManager:
             with open(self.config_file, 'w', encoding='utf-8') as f:
                 json.dump(config_dict, f, indent=2, ensure_ascii=False)
 
+            # 文件已被改写，丢弃缓存的解析结果
+            self._load_config_data.cache_clear()
+
             logger.info(f"配置已保存到: {self.config_file}")
             return True
 
@@ -203,7 +246,7 @@ class ConfigManager:
             if hasattr(self.config, key):
                 # 对路径字段进行特殊处理，转换为绝对路径
                 if key in ['project_path', 'i18n_path', 'output_path'] and value:
-                    value = os.path.abspath(value)
+                    value = _abspath(value)
                 setattr(self.config, key, value)
             else:
                 logger.warning(f"未知的配置项: {key}")
@@ -219,7 +262,7 @@ class ConfigManager:
             if hasattr(self.config, key):
                 # 对路径字段进行特殊处理，转换为绝对路径
                 if key in ['project_path', 'i18n_path', 'output_path'] and value:
-                    value = os.path.abspath(value)
+                    value = _abspath(value)
                 setattr(self.config, key, value)
             else:
                 logger.warning(f"忽略未知配置项: {key}")
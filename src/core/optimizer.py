@@ -7,20 +7,47 @@
 - 生成优化报告
 """
 
+import codecs
+import filecmp
 import json
 import os
 import shutil
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Any, Set
 
 import yaml
 
+try:
+    import orjson  # 可选依赖，C实现的JSON序列化
+except ImportError:
+    orjson = None
+
 from .analyzer import AnalysisResult, MissingKey, UnusedKey, InconsistentKey
 from .config import Config
 from .parser import ParseResult
+from ..utils.file_utils import orjson_matches_json, to_native_newlines
+
+
+@lru_cache(maxsize=8192)
+def _split_key_path(key_path: str) -> tuple:
+    """拆分点分隔的键路径，结果缓存，同一个键在移除/添加时只拆分一次"""
+    return tuple(key_path.split('.'))
+
+
+def _iter_dict_nodes(path: tuple, node: Dict):
+    """遍历以 node 为根的所有字典节点，依次产出 (路径元组, 字典节点)"""
+    stack = [(path, node)]
+    while stack:
+        path, node = stack.pop()
+        yield path, node
+        for key, value in node.items():
+            if isinstance(value, dict):
+                stack.append((path + (key,), value))
 
 
 @dataclass
@@ -96,6 +123,8 @@ class I18nOptimizer:
             # 单个对象
             i18n_files = [parse_result] if hasattr(parse_result, 'file_path') else []
 
+        pending_files = []
+
         for file_info in i18n_files:
             if not hasattr(file_info, 'file_path') or not file_info.file_path or getattr(file_info, 'error', None):
                 continue
@@ -123,25 +152,27 @@ class I18nOptimizer:
 
             print(f"[INFO]   - 优化结果: 移除 {removed_count} 个键, 添加 {added_count} 个键")
 
-            # 只有在实际做了修改时才保存文件
+            # 只有在实际做了修改时才保存文件，先收集待写入的数据，全部处理完后批量写入
             if removed_count > 0 or added_count > 0:
-                # 保存优化后的文件
-                optimized_file_path = self._save_optimized_file(file_path, optimized_data)
-
-                # 创建备份
-                backup_file_path = self._create_backup(file_path)
-
-                print(f"[INFO]   - 已保存优化文件到: {os.path.basename(optimized_file_path)}")
-
-                # 记录结果
-                optimization_result.optimized_files[file_path] = optimized_file_path
-                optimization_result.backup_files[file_path] = backup_file_path
+                pending_files.append((file_path, optimized_data))
             else:
                 print(f"[INFO]   - 文件无需优化")
 
             optimization_result.removed_keys_count += removed_count
             optimization_result.added_keys_count += added_count
 
+        # 批量保存优化后的文件并创建备份
+        written_files = self._write_optimized_files(pending_files)
+
+        for file_path, _ in pending_files:
+            optimized_file_path, backup_file_path = written_files[file_path]
+
+            print(f"[INFO] 已保存优化文件到: {os.path.basename(optimized_file_path)}")
+
+            # 记录结果
+            optimization_result.optimized_files[file_path] = optimized_file_path
+            optimization_result.backup_files[file_path] = backup_file_path
+
         print(
             f"[INFO] 优化完成: 总计移除 {optimization_result.removed_keys_count} 个键, 添加 {optimization_result.added_keys_count} 个键")
 
@@ -270,14 +301,17 @@ class I18nOptimizer:
         removed_count = 0
         added_count = 0
 
+        # 一次性建立 路径元组 -> 字典节点 的索引，增删键时直接定位父节点，无需逐级遍历
+        node_index = self._build_node_index(optimized_data)
+
         # 移除未使用的键
         for unused_key in unused_keys:
-            if self._remove_nested_key(optimized_data, unused_key):
+            if self._remove_nested_key(optimized_data, unused_key, node_index):
                 removed_count += 1
 
         # 添加缺失的键
         for missing_key, default_value in missing_keys.items():
-            if self._add_nested_key(optimized_data, missing_key, default_value):
+            if self._add_nested_key(optimized_data, missing_key, default_value, node_index):
                 added_count += 1
 
         return optimized_data, removed_count, added_count
@@ -291,45 +325,73 @@ class I18nOptimizer:
         else:
             return data
 
-    def _remove_nested_key(self, data: Dict, key_path: str) -> bool:
+    def _build_node_index(self, data: Dict) -> Dict[tuple, Dict]:
+        """
+        建立嵌套字典中所有字典节点的索引
+
+        Returns:
+            Dict[tuple, Dict]: 路径元组到字典节点的映射，根节点的路径为空元组
+        """
+        if not isinstance(data, dict):
+            return {}
+
+        return dict(_iter_dict_nodes((), data))
+
+    def _remove_nested_key(self, data: Dict, key_path: str, node_index: Dict[tuple, Dict] = None) -> bool:
         """移除嵌套键"""
         if not key_path:
             return False
 
-        keys = key_path.split('.')
-        current = data
+        keys = _split_key_path(key_path)
 
-        # 导航到父级
-        for i, key in enumerate(keys[:-1]):
-            if isinstance(current, dict) and key in current:
-                current = current[key]
-            else:
-                return False  # 键不存在
+        if node_index is not None:
+            # 通过索引直接定位父级
+            current = node_index.get(keys[:-1])
+        else:
+            current = data
+
+            # 导航到父级
+            for key in keys[:-1]:
+                if isinstance(current, dict) and key in current:
+                    current = current[key]
+                else:
+                    return False  # 键不存在
 
         # 移除最后一级键
         final_key = keys[-1]
         if isinstance(current, dict) and final_key in current:
-            del current[final_key]
+            removed = current.pop(final_key)
+
+            # 移除的是子树时，只遍历该子树清理索引中对应的节点，无需扫描整个索引
+            if node_index is not None and isinstance(removed, dict):
+                for path, _ in _iter_dict_nodes(keys, removed):
+                    node_index.pop(path, None)
             return True
 
         return False
 
-    def _add_nested_key(self, data: Dict, key_path: str, value: str) -> bool:
+    def _add_nested_key(self, data: Dict, key_path: str, value: str, node_index: Dict[tuple, Dict] = None) -> bool:
         """添加嵌套键"""
         if not key_path:
             return False
 
-        keys = key_path.split('.')
-        current = data
+        keys = _split_key_path(key_path)
+        current = node_index.get(keys[:-1]) if node_index is not None else None
 
-        # 导航并创建嵌套结构
-        for i, key in enumerate(keys[:-1]):
-            if key not in current:
-                current[key] = {}
-            elif not isinstance(current[key], dict):
-                # 如果存在但不是字典，则跳过
-                return False
-            current = current[key]
+        if current is None:
+            current = data
+
+            # 导航并创建嵌套结构
+            for i, key in enumerate(keys[:-1]):
+                if key not in current:
+                    current[key] = {}
+                elif not isinstance(current[key], dict):
+                    # 如果存在但不是字典，则跳过
+                    return False
+                current = current[key]
+
+                if node_index is not None:
+                    node_index[keys[:i + 1]] = current
 
         # 添加最后一级键（只有当键不存在时）
         final_key = keys[-1]
@@ -339,6 +401,36 @@ class I18nOptimizer:
 
         return False
 
+    def _write_optimized_files(self, pending_files: List[tuple]) -> Dict[str, tuple]:
+        """
+        使用线程池批量保存优化后的文件并创建备份
+
+        输出目录只保留文件名，同名文件被分到同一组按处理顺序串行写入，
+        保证与逐个写入时一样由最后处理的文件生效。
+
+        Args:
+            pending_files: (原文件路径, 优化后数据) 列表
+
+        Returns:
+            Dict[str, tuple]: 原文件路径 -> (优化文件路径, 备份文件路径)
+        """
+        if not pending_files:
+            return {}
+
+        groups = defaultdict(list)
+        for file_path, optimized_data in pending_files:
+            groups[Path(file_path).name].append((file_path, optimized_data))
+
+        def write_group(group: List[tuple]) -> List[tuple]:
+            return [(file_path, self._save_optimized_file(file_path, optimized_data), self._create_backup(file_path))
+                    for file_path, optimized_data in group]
+
+        with ThreadPoolExecutor(max_workers=min(8, len(groups))) as executor:
+            group_results = list(executor.map(write_group, groups.values()))
+
+        return {file_path: (optimized_file_path, backup_file_path) for group_result in group_results for
+                file_path, optimized_file_path, backup_file_path in group_result}
+
     def _save_optimized_file(self, original_file_path: str, optimized_data: Dict) -> str:
         """保存优化后的文件"""
         # 使用会话特定的optimized目录
@@ -377,8 +469,9 @@ class I18nOptimizer:
         # 创建备份文件路径
         backup_file_path = backup_path / file_name
 
-        # 复制文件
-        shutil.copy2(original_file_path, backup_file_path)
+        # 复制文件内容（备份无需保留元数据），已有内容相同的备份时跳过
+        if not (backup_file_path.exists() and filecmp.cmp(original_file_path, backup_file_path, shallow=False)):
+            shutil.copyfile(original_file_path, backup_file_path)
 
         return str(backup_file_path)
 
@@ -391,19 +484,63 @@ class I18nOptimizer:
             file_path.parent.mkdir(parents=True, exist_ok=True)
 
             if file_extension == '.json':
-                with open(file_path, 'w', encoding=self.config.encoding) as f:
-                    json.dump(data, f, ensure_ascii=False, indent=2)
+                self._write_json(file_path, data)
             elif file_extension in ['.yml', '.yaml']:
                 with open(file_path, 'w', encoding=self.config.encoding) as f:
                     yaml.dump(data, f, default_flow_style=False, allow_unicode=True)
             else:
                 # 默认使用JSON格式
-                with open(file_path, 'w', encoding=self.config.encoding) as f:
-                    json.dump(data, f, ensure_ascii=False, indent=2)
+                self._write_json(file_path, data)
         except Exception as e:
             print(f"Error saving file {file_path}: {e}")
             raise  # 重新抛出异常，让上层调用者知道保存失败
 
+    def _write_json(self, file_path: Path, data: Any) -> None:
+        """
+        以缩进格式写入JSON文件
+
+        输出编码为UTF-8且安装了orjson时，直接序列化为字节并单次写入，换行符转换为平台换行符，
+        结果与标准库json以文本模式写入的字节完全相同；否则（或数据中有两者输出不同的值，
+        如非字符串键、NaN）使用标准库json。
+
+        Args:
+            file_path: 文件路径
+            data: 要写入的数据
+        """
+        if orjson is not None and codecs.lookup(self.config.encoding).name == 'utf-8' and orjson_matches_json(data):
+            try:
+                content = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            except orjson.JSONEncodeError:
+                pass
+            else:
+                self._write_bytes_if_changed(file_path, to_native_newlines(content))
+                return
+
+        with open(file_path, 'w', encoding=self.config.encoding) as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+    def _write_bytes_if_changed(self, file_path: Path, content: bytes) -> bool:
+        """
+        写入字节内容，目标文件已存在且内容完全相同时跳过写入
+
+        同一秒内重复执行优化会落到同一个会话目录，此时输出通常与已有文件一致。
+
+        Args:
+            file_path: 文件路径
+            content: 要写入的字节内容
+
+        Returns:
+            bool: 是否实际写入了文件
+        """
+        try:
+            if file_path.stat().st_size == len(content) and file_path.read_bytes() == content:
+                return False
+        except OSError:
+            pass
+
+        file_path.write_bytes(content)
+        return True
+
     def _generate_optimization_summary(self, analysis_result: AnalysisResult,
                                        optimization_result: OptimizationResult) -> Dict[str, Any]:
         """生成优化摘要"""
@@ -444,35 +581,32 @@ class I18nOptimizer:
         try:
             # 保存JSON报告
             report_file = reports_path / "optimization_report.json"
-            with open(report_file, 'w', encoding=self.config.encoding) as f:
-                json.dump(detailed_report, f, ensure_ascii=False, indent=2)
+            self._write_json(report_file, detailed_report)
+
+            # 保存文本报告：先在内存中拼接全部内容，再一次性写入
+            report_lines = ["国际化文件优化报告", "=" * 50, "", "优化统计:",
+                            f"  - 移除未使用键: {optimization_result.removed_keys_count} 个",
+                            f"  - 添加缺失键: {optimization_result.added_keys_count} 个",
+                            f"    (包含 {len(analysis_result.inconsistent_keys)} 个不一致键的补全)",
+                            f"  - 优化文件数: {len(optimization_result.optimized_files)} 个", ""]
+
+            # 添加不一致键的详细信息
+            if analysis_result.inconsistent_keys:
+                report_lines.append("不一致键处理:")
+                report_lines.extend(f"  - 键 '{ik.key}' 已补全到文件: {', '.join(ik.missing_files)}" for ik in
+                                    analysis_result.inconsistent_keys if ik.key in analysis_result.used_keys_detail)
+                report_lines.append("")
+
+            report_lines.append("优化后的文件:")
+            report_lines.extend(f"  - {original} -> {optimized}" for original, optimized in
+                                optimization_result.optimized_files.items())
+
+            report_lines.extend(["", "备份文件:"])
+            report_lines.extend(f"  - {original} -> {backup}" for original, backup in
+                                optimization_result.backup_files.items())
 
-            # 保存文本报告
             text_report_file = reports_path / "optimization_report.txt"
-            with open(text_report_file, 'w', encoding=self.config.encoding) as f:
-                f.write("国际化文件优化报告\n")
-                f.write("=" * 50 + "\n\n")
-                f.write(f"优化统计:\n")
-                f.write(f"  - 移除未使用键: {optimization_result.removed_keys_count} 个\n")
-                f.write(f"  - 添加缺失键: {optimization_result.added_keys_count} 个\n")
-                f.write(f"    (包含 {len(analysis_result.inconsistent_keys)} 个不一致键的补全)\n")
-                f.write(f"  - 优化文件数: {len(optimization_result.optimized_files)} 个\n\n")
-
-                # 添加不一致键的详细信息
-                if analysis_result.inconsistent_keys:
-                    f.write("不一致键处理:\n")
-                    for ik in analysis_result.inconsistent_keys:
-                        if ik.key in analysis_result.used_keys_detail:
-                            f.write(f"  - 键 '{ik.key}' 已补全到文件: {', '.join(ik.missing_files)}\n")
-                    f.write("\n")
-
-                f.write("优化后的文件:\n")
-                for original, optimized in optimization_result.optimized_files.items():
-                    f.write(f"  - {original} -> {optimized}\n")
-
-                f.write("\n备份文件:\n")
-                for original, backup in optimization_result.backup_files.items():
-                    f.write(f"  - {original} -> {backup}\n")
+            text_report_file.write_text("\n".join(report_lines) + "\n", encoding=self.config.encoding)
 
         except Exception as e:
             print(f"Error saving optimization report: {e}")
@@ -503,7 +637,7 @@ class I18nOptimizer:
         if analysis_result.missing_keys:
             print(f"\n缺失键详情:")
             for mk in analysis_result.missing_keys[:5]:  # 只显示前5个
-                print(f"  - {mk.key} (建议文件: {mk.suggested_files})")
+                print(f"  - {mk.key} (建议文件: {', '.join(mk.suggested_files)})")
             if len(analysis_result.missing_keys) > 5:
                 print(f"  ... 还有 {len(analysis_result.missing_keys) - 5} 个")
 
@@ -6,17 +6,27 @@
 
 import logging
 import os
-from dataclasses import dataclass
-from typing import Dict, List, Set, Any, Optional
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, List, Set, Any, Optional, Tuple
 
 from .config import get_config
 from ..parsers import get_parser_by_file, is_supported_file, ParserFactory
+from ..parsers.base import BaseParser
+from ..parsers.json_parser import JsonParseResult
 from ..utils.path_utils import find_i18n_files, get_relative_path
 
 logger = logging.getLogger(__name__)
 
+# dataclass 的 slots 参数需要 Python 3.10+
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+# 文件数少于该值时顺序解析，避免线程池的创建开销
+_PARALLEL_MIN_FILES = 4
+
+
+@dataclass(**_SLOTS)
 class I18nFileInfo:
     """国际化文件信息"""
     file_path: str
@@ -28,18 +38,32 @@ class I18nFileInfo:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ParseResult:
     """解析结果"""
     files: List[I18nFileInfo]
-    total_keys: Set[str]
+    total_keys: FrozenSet[str]
     duplicate_keys: Dict[str, List[str]]  # 重复的键及其所在文件
     inconsistent_keys: Dict[str, Dict[str, List[str]]]  # 不一致的键
     parse_errors: List[str]
+    # all_keys 的计算结果，首次访问时生成
+    _all_keys_cache: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # 解析完成后键集合只读，统一冻结，调用方传入普通集合时也一样
+        if not isinstance(self.total_keys, frozenset):
+            self.total_keys = frozenset(self.total_keys)
 
     @property
     def all_keys(self) -> Dict[str, Any]:
-        """获取所有键的字典格式，兼容旧接口"""
+        """
+        获取所有键的字典格式，兼容旧接口
+
+        结果在首次访问时计算并缓存，解析完成后 files 不应再修改。
+        """
+        if self._all_keys_cache is not None:
+            return self._all_keys_cache
+
         all_keys_dict = {}
         for file_info in self.files:
             if not file_info.error:
@@ -52,6 +76,7 @@ class ParseResult:
                             all_keys_dict[key] = value
                         else:
                             all_keys_dict[key] = ""
+        self._all_keys_cache = all_keys_dict
         return all_keys_dict
 
     @property
@@ -116,7 +141,7 @@ class I18nFileParser:
 
         if not os.path.exists(target_dir):
             logger.error(f"国际化目录不存在: {target_dir}")
-            return ParseResult([], set(), {}, {}, [f"目录不存在: {target_dir}"])
+            return ParseResult([], frozenset(), {}, {}, [f"目录不存在: {target_dir}"])
 
         logger.info(f"开始解析国际化目录: {target_dir}")
 
@@ -126,7 +151,7 @@ class I18nFileParser:
 
         if not i18n_files:
             logger.warning(f"在目录中未找到支持的国际化文件: {target_dir}")
-            return ParseResult([], set(), {}, {}, [f"未找到支持的国际化文件"])
+            return ParseResult([], frozenset(), {}, {}, [f"未找到支持的国际化文件"])
 
         logger.info(f"找到 {len(i18n_files)} 个国际化文件")
 
@@ -134,24 +159,28 @@ class I18nFileParser:
         self.parsed_files = []
         parse_errors = []
 
-        for file_path in i18n_files:
-            try:
-                file_info = self._parse_single_file(file_path)
-                self.parsed_files.append(file_info)
-
-                if file_info.error:
-                    parse_errors.append(f"{file_info.relative_path}: {file_info.error}")
-
-            except Exception as e:
-                error_msg = f"解析文件失败 {file_path}: {e}"
+        if len(i18n_files) < _PARALLEL_MIN_FILES or self.config.max_threads <= 1:
+            outcomes = map(self._try_parse_single_file, i18n_files)
+        else:
+            # 文件读取在阻塞的 read 调用期间释放GIL，多个线程的磁盘等待已能相互重叠；
+            # aiofiles 内部同样是线程池，io_uring 需要额外绑定且只适用于Linux，均不再引入。
+            # executor.map 按提交顺序返回结果，文件顺序与查找顺序一致
+            with ThreadPoolExecutor(max_workers=min(self.config.max_threads, len(i18n_files))) as executor:
+                outcomes = list(executor.map(self._try_parse_single_file, i18n_files))
+
+        for file_path, (file_info, exception) in zip(i18n_files, outcomes):
+            if exception is not None:
+                error_msg = f"解析文件失败 {file_path}: {exception}"
                 logger.error(error_msg)
                 parse_errors.append(error_msg)
+                continue
+
+            self.parsed_files.append(file_info)
+            if file_info.error:
+                parse_errors.append(f"{file_info.relative_path}: {file_info.error}")
 
         # 分析结果
-        total_keys = set()
-        for file_info in self.parsed_files:
-            if not file_info.error:
-                total_keys.update(file_info.keys)
+        total_keys = frozenset().union(*(file_info.keys for file_info in self.parsed_files if not file_info.error))
 
         # 查找重复键和不一致键
         duplicate_keys = self._find_duplicate_keys()
@@ -194,11 +223,7 @@ class I18nFileParser:
 
     def get_all_keys(self) -> Set[str]:
         """获取所有解析的键"""
-        all_keys = set()
-        for file_info in self.parsed_files:
-            if not file_info.error:
-                all_keys.update(file_info.keys)
-        return all_keys
+        return set().union(*(file_info.keys for file_info in self.parsed_files if not file_info.error))
 
     def get_keys_by_file(self) -> Dict[str, Set[str]]:
         """获取按文件分组的键"""
@@ -248,6 +273,21 @@ class I18nFileParser:
 
         return None
 
+    def _try_parse_single_file(self, file_path: str) -> Tuple[Optional[I18nFileInfo], Optional[Exception]]:
+        """
+        解析单个文件并捕获异常，供线程池调用
+
+        Args:
+            file_path: 文件路径
+
+        Returns:
+            Tuple[Optional[I18nFileInfo], Optional[Exception]]: (文件信息, 异常)，两者只有一个不为None
+        """
+        try:
+            return self._parse_single_file(file_path), None
+        except Exception as e:
+            return None, e
+
     def _parse_single_file(self, file_path: str) -> I18nFileInfo:
         """
         解析单个文件的内部实现
@@ -282,11 +322,18 @@ class I18nFileParser:
                 keys = result.keys
                 data = result.data
                 parser_type = getattr(result, 'parser_type', parser.__class__.__name__)
+                keys_interned = isinstance(result, JsonParseResult)
             else:
                 # Old style result - just data dict
                 data = result
                 keys = parser.flatten_keys(data)
                 parser_type = parser.__class__.__name__
+                keys_interned = isinstance(parser, BaseParser)
+
+            # 驻留键字符串，与扫描结果中的同名键共享同一对象，集合运算时走指针比较的快速路径
+            # （BaseParser.flatten_keys 生成的键已驻留，无需再遍历一遍）
+            if not keys_interned:
+                keys = {sys.intern(key) for key in keys}
 
             logger.debug(f"解析文件成功 {relative_path}: {len(keys)} 个键")
 
@@ -306,10 +353,13 @@ class I18nFileParser:
             if file_info.error:
                 continue
 
+            relative_path = file_info.relative_path
             for key in file_info.keys:
-                if key not in key_files:
-                    key_files[key] = []
-                key_files[key].append(file_info.relative_path)
+                files = key_files.get(key)
+                if files is None:
+                    key_files[key] = [relative_path]
+                else:
+                    files.append(relative_path)
 
         # 只返回出现在多个文件中的键
         duplicate_keys = {key: files for key, files in key_files.items() if len(files) > 1}
@@ -346,13 +396,13 @@ class I18nFileParser:
             if len(files) <= 1:
                 continue
 
-            # 收集所有键
-            all_keys = set()
-            for file_info in files:
-                all_keys.update(file_info.keys)
+            # 只有不在所有文件中都出现的键（并集减交集）才可能不一致，其余键无需逐个检查
+            file_key_sets = [file_info.keys for file_info in files]
+            common_keys = file_key_sets[0].intersection(*file_key_sets[1:])
+            candidate_keys = set().union(*file_key_sets) - common_keys
 
             # 检查每个键是否在所有文件中都存在
-            for key in all_keys:
+            for key in candidate_keys:
                 files_with_key = [f.relative_path for f in files if key in f.keys]
                 files_without_key = [f.relative_path for f in files if key not in f.keys]
 
@@ -11,6 +11,100 @@ from typing import Dict, List, Any
 from .analyzer import AnalysisResult
 from .config import Config
 from .parser import ParseResult
+from ..utils.file_utils import orjson_matches_json, to_native_newlines
+
+try:
+    import orjson  # 可选依赖，C实现的JSON序列化，原生支持dataclass
+except ImportError:
+    orjson = None
+
+# 流式写出JSON报告时逐项展开的最大层级，更深的值整体序列化
+_STREAM_MAX_LEVEL = 3
+
+# 分块写出JSON报告时每次交给orjson序列化的元素数量
+_STREAM_CHUNK_SIZE = 1000
+
+# 文本报告中固定不变的分隔线与标题，在模块加载时构建一次
+_SEPARATOR = "=" * 60
+_SUMMARY_SEPARATOR = "=" * 40
+_FILE_SEPARATOR = "-" * 40
+_SUB_SEPARATOR = "-" * 30
+_FILE_OVERVIEW_HEADER = ("", "文件统计概览:", _SUB_SEPARATOR)
+_DETAIL_LIST_HEADER = ("", "详细列表:", _SUB_SEPARATOR)
+_HDR_OVERVIEW = (_SEPARATOR, "1. 概览统计", _SEPARATOR)
+_HDR_MISSING = (_SEPARATOR, "2. 缺失的国际化文本", _SEPARATOR)
+_HDR_UNUSED = ("", _SEPARATOR, "3. 未使用的国际化文本", _SEPARATOR)
+_HDR_INCONSISTENT = ("", _SEPARATOR, "4. 不一致的国际化字段", _SEPARATOR)
+_HDR_VARIABLE_INTERPOLATION = ("", _SEPARATOR, "5. 变量插值的国际化调用", _SEPARATOR)
+_HDR_FILE_COVERAGE = ("", _SEPARATOR, "6. 文件覆盖情况", _SEPARATOR)
+_HDR_SUGGESTIONS = ("", _SEPARATOR, "7. 改进建议", _SEPARATOR)
+_REPORT_FOOTER = ("", _SEPARATOR, "报告结束", _SEPARATOR)
+_VARIABLE_INTERPOLATION_NOTES = ("", "⚠️  注意事项:", _SUB_SEPARATOR, "  这些调用使用了变量插值，可能在运行时动态生成具体的键值。",
+                                 "  在删除未使用的国际化键时，请检查这些模式是否可能匹配到您要删除的键。",
+                                 "  例如：t(`words.${pos}`) 可能会匹配 words.0, words.1, words.home 等键。",
+                                 "  建议在删除键之前，仔细检查优化后的文件是否误删了这些动态引用的键。", "")
+
+
+def _write_json_stream(write, value: Any, level: int = 0) -> None:
+    """
+    以与 json.dump(indent=2) 相同的格式流式写出JSON
+
+    前几层的字典和列表逐项展开写出，更深层的值（如单条缺失键记录）整体交给orjson序列化，
+    再按所在层级补齐缩进。JSON字符串中的换行都会被转义，因此按换行符补缩进是安全的。
+    元素都整体序列化的容器按 _STREAM_CHUNK_SIZE 分块交给orjson，减少逐条调用的开销。
+
+    Args:
+        write: 写入字节的函数
+        value: 要写出的值
+        level: 当前缩进层级
+    """
+    is_dict = isinstance(value, dict)
+    if level >= _STREAM_MAX_LEVEL or not (is_dict or isinstance(value, (list, tuple))) or not value:
+        content = orjson.dumps(value, option=orjson.OPT_INDENT_2)
+        write(content.replace(b'\n', b'\n' + b'  ' * level) if level else content)
+        return
+
+    children = value.values() if is_dict else value
+    if level + 1 >= _STREAM_MAX_LEVEL or not any(isinstance(child, (dict, list, tuple)) for child in children):
+        _write_json_chunks(write, value, is_dict, level)
+        return
+
+    child_indent = b'\n' + b'  ' * (level + 1)
+    write(b'{' if is_dict else b'[')
+    for index, item in enumerate(value.items() if is_dict else value):
+        write(child_indent if index == 0 else b',' + child_indent)
+        if is_dict:
+            write(orjson.dumps(item[0]) + b': ')
+            item = item[1]
+        _write_json_stream(write, item, level + 1)
+    write(b'\n' + b'  ' * level + (b'}' if is_dict else b']'))
+
+
+def _write_json_chunks(write, value: Any, is_dict: bool, level: int) -> None:
+    """
+    将元素整体序列化的非空容器分块写出
+
+    每块序列化为同类型的容器后去掉首尾括号行，只保留元素部分，再按所在层级补齐缩进，
+    拼接后的结果与整体序列化完全一致，内存中同时只保留一块的序列化结果。
+
+    Args:
+        write: 写入字节的函数
+        value: 非空的字典或列表
+        is_dict: value 是否为字典
+        level: 当前缩进层级
+    """
+    indent = b'  ' * level
+    line_break = b'\n' + indent
+    items = list(value.items()) if is_dict else value
+
+    write(b'{' if is_dict else b'[')
+    for start in range(0, len(items), _STREAM_CHUNK_SIZE):
+        chunk = items[start:start + _STREAM_CHUNK_SIZE]
+        content = orjson.dumps(dict(chunk) if is_dict else chunk, option=orjson.OPT_INDENT_2)
+        # 去掉 "[\n" / "{\n" 与 "\n]" / "\n}"，剩下的是缩进一级的元素行
+        body = content[2:-2]
+        write((b',' if start else b'') + line_break + (body.replace(b'\n', line_break) if level else body))
+    write(line_break + (b'}' if is_dict else b']'))
 
 
 class ReportGenerator:
@@ -50,11 +144,12 @@ class ReportGenerator:
 
         # 报告头部
         report_lines.extend(
-            ["=" * 60, "国际化分析报告", "=" * 60, f"生成时间: {timestamp}", f"项目路径: {self.config.project_path}",
+            [_SEPARATOR, "国际化分析报告", _SEPARATOR, f"生成时间: {timestamp}", f"项目路径: {self.config.project_path}",
              f"国际化目录: {self.config.i18n_path}", f"输出目录: {self.config.output_path}", "", ])
 
         # 概览统计
-        report_lines.extend(["=" * 60, "1. 概览统计", "=" * 60, f"总使用键数: {analysis_result.total_used_keys}",
+        report_lines.extend(_HDR_OVERVIEW)
+        report_lines.extend([f"总使用键数: {analysis_result.total_used_keys}",
                              f"总定义键数: {analysis_result.total_defined_keys}",
                              f"匹配键数: {analysis_result.matched_keys}",
                              f"覆盖率: {analysis_result.coverage_percentage:.2f}%",
@@ -64,16 +159,16 @@ class ReportGenerator:
 
         # 缺失的国际化文本
         if analysis_result.missing_keys:
-            report_lines.extend(["=" * 60, "2. 缺失的国际化文本", "=" * 60, ])
+            report_lines.extend(_HDR_MISSING)
 
             # 按文件分组显示统计概览
             missing_keys_by_file = getattr(analysis_result, 'missing_keys_by_file', {})
             if missing_keys_by_file:
-                report_lines.extend(["", "文件统计概览:", "-" * 30, ])
+                report_lines.extend(_FILE_OVERVIEW_HEADER)
                 for file_path, missing_list in missing_keys_by_file.items():
                     report_lines.append(f"  {file_path}: {len(missing_list)} 个缺失键")
 
-            report_lines.extend(["", "详细列表:", "-" * 30, ])
+            report_lines.extend(_DETAIL_LIST_HEADER)
 
             # 按文件分组显示详细信息
             missing_by_file = {}
@@ -84,27 +179,28 @@ class ReportGenerator:
 
             for file_path, missing_list in missing_by_file.items():
                 report_lines.append(f"\n文件: {file_path}")
-                report_lines.append("-" * 40)
+                report_lines.append(_FILE_SEPARATOR)
                 for missing in missing_list:
                     report_lines.append(f"  行 {missing.line_number}: '{missing.key}'")
                     if missing.suggested_files:
                         suggestions = ", ".join(missing.suggested_files)
                         report_lines.append(f"    建议添加到: {suggestions}")
         else:
-            report_lines.extend(["=" * 60, "2. 缺失的国际化文本", "=" * 60, "✅ 没有发现缺失的国际化文本！", "", ])
+            report_lines.extend(_HDR_MISSING)
+            report_lines.extend(["✅ 没有发现缺失的国际化文本！", ""])
 
         # 未使用的国际化文本
         if analysis_result.unused_keys:
-            report_lines.extend(["", "=" * 60, "3. 未使用的国际化文本", "=" * 60, ])
+            report_lines.extend(_HDR_UNUSED)
 
             # 按文件分组显示统计概览
             unused_keys_by_file = getattr(analysis_result, 'unused_keys_by_file', {})
             if unused_keys_by_file:
-                report_lines.extend(["", "文件统计概览:", "-" * 30, ])
+                report_lines.extend(_FILE_OVERVIEW_HEADER)
                 for file_path, unused_list in unused_keys_by_file.items():
                     report_lines.append(f"  {file_path}: {len(unused_list)} 个未使用键")
 
-            report_lines.extend(["", "详细列表:", "-" * 30, ])
+            report_lines.extend(_DETAIL_LIST_HEADER)
 
             # 按文件分组显示详细信息
             unused_by_file = {}
@@ -115,58 +211,54 @@ class ReportGenerator:
 
             for file_path, unused_list in unused_by_file.items():
                 report_lines.append(f"\n文件: {file_path}")
-                report_lines.append("-" * 40)
+                report_lines.append(_FILE_SEPARATOR)
                 for unused in unused_list:
                     report_lines.append(f"  '{unused.key}': {unused.value}")
         else:
-            report_lines.extend(
-                ["", "=" * 60, "3. 未使用的国际化文本", "=" * 60, "✅ 没有发现未使用的国际化文本！", "", ])
+            report_lines.extend(_HDR_UNUSED)
+            report_lines.extend(["✅ 没有发现未使用的国际化文本！", ""])
 
         # 不一致的国际化字段
         if analysis_result.inconsistent_keys:
-            report_lines.extend(["", "=" * 60, "4. 不一致的国际化字段", "=" * 60, ])
+            report_lines.extend(_HDR_INCONSISTENT)
 
             for inconsistent in analysis_result.inconsistent_keys:
                 report_lines.append(f"\n键: '{inconsistent.key}'")
                 report_lines.append(f"  存在于: {', '.join(inconsistent.existing_files)}")
                 report_lines.append(f"  缺失于: {', '.join(inconsistent.missing_files)}")
         else:
-            report_lines.extend(
-                ["", "=" * 60, "4. 不一致的国际化字段", "=" * 60, "✅ 没有发现不一致的国际化字段！", "", ])
+            report_lines.extend(_HDR_INCONSISTENT)
+            report_lines.extend(["✅ 没有发现不一致的国际化字段！", ""])
 
         # 变量插值的国际化调用  
         if analysis_result.variable_interpolation_calls:
-            report_lines.extend(["", "=" * 60, "5. 变量插值的国际化调用", "=" * 60, ])
+            report_lines.extend(_HDR_VARIABLE_INTERPOLATION)
 
             # 按文件统计概览
             variable_interpolation_by_file = analysis_result.variable_interpolation_by_file
             if variable_interpolation_by_file:
-                report_lines.extend(["", "文件统计概览:", "-" * 30, ])
+                report_lines.extend(_FILE_OVERVIEW_HEADER)
                 for file_path, vi_list in variable_interpolation_by_file.items():
                     report_lines.append(f"  {file_path}: {len(vi_list)} 个变量插值调用")
 
-            report_lines.extend(["", "详细列表:", "-" * 30, ])
+            report_lines.extend(_DETAIL_LIST_HEADER)
 
             # 按文件分组显示详细信息
             for file_path, vi_list in variable_interpolation_by_file.items():
                 report_lines.append(f"\n文件: {file_path}")
-                report_lines.append("-" * 40)
+                report_lines.append(_FILE_SEPARATOR)
                 for vi_call in vi_list:
                     report_lines.append(f"  行 {vi_call.line_number}: {vi_call.match_text}")
                     report_lines.append(f"    键模式: '{vi_call.key}'")
 
-            report_lines.extend(
-                ["", "⚠️  注意事项:", "-" * 30, "  这些调用使用了变量插值，可能在运行时动态生成具体的键值。",
-                 "  在删除未使用的国际化键时，请检查这些模式是否可能匹配到您要删除的键。",
-                 "  例如：t(`words.${pos}`) 可能会匹配 words.0, words.1, words.home 等键。",
-                 "  建议在删除键之前，仔细检查优化后的文件是否误删了这些动态引用的键。", ""])
+            report_lines.extend(_VARIABLE_INTERPOLATION_NOTES)
         else:
-            report_lines.extend(
-                ["", "=" * 60, "5. 变量插值的国际化调用", "=" * 60, "✅ 没有发现变量插值的国际化调用。", "", ])
+            report_lines.extend(_HDR_VARIABLE_INTERPOLATION)
+            report_lines.extend(["✅ 没有发现变量插值的国际化调用。", ""])
 
         # 文件覆盖情况
         if analysis_result.file_coverage:
-            report_lines.extend(["", "=" * 60, "6. 文件覆盖情况", "=" * 60, ])
+            report_lines.extend(_HDR_FILE_COVERAGE)
 
             for file_path, coverage in analysis_result.file_coverage.items():
                 report_lines.extend([f"\n文件: {file_path}", f"  总调用数: {coverage.total_calls}",
@@ -176,11 +268,11 @@ class ReportGenerator:
         # 建议部分
         suggestions = self._generate_suggestions(analysis_result)
         if suggestions:
-            report_lines.extend(["", "=" * 60, "7. 改进建议", "=" * 60, ])
+            report_lines.extend(_HDR_SUGGESTIONS)
             report_lines.extend(suggestions)
 
         # 报告尾部
-        report_lines.extend(["", "=" * 60, "报告结束", "=" * 60, ])
+        report_lines.extend(_REPORT_FOOTER)
 
         # 写入文件
         report_content = "\n".join(report_lines)
@@ -239,41 +331,40 @@ class ReportGenerator:
 
         reports_path.mkdir(parents=True, exist_ok=True)
 
-        # 构建报告数据
+        # 构建报告数据（dataclass 对象在序列化时才转换为字典）
         report_data = {'timestamp': datetime.now().isoformat(),
                        'summary': {'total_used_keys': analysis_result.total_used_keys,
                                    'total_defined_keys': analysis_result.total_defined_keys,
                                    'matched_keys': analysis_result.matched_keys,
                                    'coverage_percentage': analysis_result.coverage_percentage,
                                    'variable_interpolation_count': len(analysis_result.variable_interpolation_calls)},
-                       'missing_keys': [asdict(mk) for mk in analysis_result.missing_keys],
-                       'missing_keys_by_file': {file_path: [asdict(mk) for mk in missing_list] for
-                                                file_path, missing_list in
-                                                getattr(analysis_result, 'missing_keys_by_file', {}).items()},
+                       'missing_keys': analysis_result.missing_keys,
+                       'missing_keys_by_file': getattr(analysis_result, 'missing_keys_by_file', {}),
                        'missing_keys_summary_by_file': getattr(analysis_result, 'get_missing_keys_summary_by_file',
                                                                lambda: {})(),
-                       'unused_keys': [asdict(uk) for uk in analysis_result.unused_keys],
-                       'unused_keys_by_file': {file_path: [asdict(uk) for uk in unused_list] for file_path, unused_list
-                                               in getattr(analysis_result, 'unused_keys_by_file', {}).items()},
+                       'unused_keys': analysis_result.unused_keys,
+                       'unused_keys_by_file': getattr(analysis_result, 'unused_keys_by_file', {}),
                        'unused_keys_summary_by_file': getattr(analysis_result, 'get_unused_keys_summary_by_file',
                                                               lambda: {})(),
-                       'inconsistent_keys': [asdict(ik) for ik in analysis_result.inconsistent_keys],
-                       'variable_interpolation_calls': [asdict(vi) for vi in
-                                                        analysis_result.variable_interpolation_calls],
-                       'variable_interpolation_by_file': {file_path: [asdict(vi) for vi in vi_list] for
-                                                          file_path, vi_list in
-                                                          analysis_result.variable_interpolation_by_file.items()},
+                       'inconsistent_keys': analysis_result.inconsistent_keys,
+                       'variable_interpolation_calls': analysis_result.variable_interpolation_calls,
+                       'variable_interpolation_by_file': analysis_result.variable_interpolation_by_file,
                        'variable_interpolation_summary_by_file': getattr(analysis_result,
                                                                          'get_variable_interpolation_summary_by_file',
                                                                          lambda: {})(),
-                       'file_coverage': {file_path: asdict(coverage) for file_path, coverage in
-                                         analysis_result.file_coverage.items()}}
+                       'file_coverage': analysis_result.file_coverage}
 
         # 写入JSON文件
         json_file = reports_path / "analysis_report.json"
 
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(report_data, f, ensure_ascii=False, indent=2)
+        if orjson is not None and orjson_matches_json(report_data):
+            # 按记录逐条序列化写入，内存中同时只保留一条记录的序列化结果；
+            # 换行符转换为平台换行符，与标准库json以文本模式写入的字节相同
+            with open(json_file, 'wb') as f:
+                _write_json_stream(lambda chunk: f.write(to_native_newlines(chunk)), report_data)
+        else:
+            with open(json_file, 'w', encoding='utf-8') as f:
+                json.dump(report_data, f, ensure_ascii=False, indent=2, default=asdict)
 
         return str(json_file)
 
@@ -373,7 +464,7 @@ class ReportGenerator:
         Returns:
             str: 摘要报告内容
         """
-        summary_lines = ["=" * 40, "国际化分析摘要", "=" * 40, f"📊 覆盖率: {analysis_result.coverage_percentage:.1f}%",
+        summary_lines = [_SUMMARY_SEPARATOR, "国际化分析摘要", _SUMMARY_SEPARATOR, f"📊 覆盖率: {analysis_result.coverage_percentage:.1f}%",
                          f"✅ 匹配键: {analysis_result.matched_keys}/{analysis_result.total_used_keys}",
                          f"❌ 缺失键: {len(analysis_result.missing_keys)}",
                          f"🗑️ 未使用键: {len(analysis_result.unused_keys)}",
@@ -396,6 +487,6 @@ class ReportGenerator:
                 file_name = file_path.split('/')[-1] if '/' in file_path else file_path.split('\\')[-1]
                 summary_lines.append(f"   {file_name}: {len(vi_list)} 个")
 
-        summary_lines.append("=" * 40)
+        summary_lines.append(_SUMMARY_SEPARATOR)
 
         return "\n".join(summary_lines)
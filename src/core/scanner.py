@@ -7,9 +7,12 @@
 
 import logging
 import os
+import sys
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
+from functools import partial
 from typing import List, Dict, Any, Optional, Callable, Set
 
 from .config import get_config
@@ -19,8 +22,15 @@ from ..utils.pattern_utils import find_i18n_keys_in_text
 
 logger = logging.getLogger(__name__)
 
+# 实例数量大的数据类使用 __slots__，节省内存并加快属性访问（Python 3.10+ 才支持 slots 参数）
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+# 文件数达到该值且有多个CPU核心时改用进程池扫描：正则匹配受GIL限制，线程无法并行；
+# 文件较少时进程启动和结果传输的开销大于收益
+_PROCESS_POOL_MIN_FILES = 200
+
+
+@dataclass(**_SLOTS)
 class I18nCall:
     """国际化调用信息"""
     key: str
@@ -30,8 +40,13 @@ class I18nCall:
     pattern: Optional[str] = None
     context: Optional[str] = None
 
+    def __post_init__(self):
+        """驻留键字符串，使跨文件重复的键共享同一对象"""
+        if isinstance(self.key, str):
+            self.key = sys.intern(self.key)
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class ScanResult:
     """扫描结果数据结构"""
     file_path: str
@@ -55,7 +70,7 @@ class ScanSummary:
     scan_time: float
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ProjectScanResult:
     """项目扫描结果 - 为analyzer模块提供兼容接口"""
     i18n_calls: List[I18nCall]
@@ -68,31 +83,25 @@ class ProjectScanResult:
     @classmethod
     def from_summary_and_results(cls, summary: ScanSummary, results: List[ScanResult]) -> 'ProjectScanResult':
         """从ScanSummary和ScanResult列表创建ProjectScanResult"""
-        i18n_calls = []
-        variable_interpolation_calls = []
+        from .analyzer import VariableInterpolationCall
+
+        # 列表推导式逐项构建，类名绑定为局部变量，省去循环中的全局查找和 append 方法调用
+        call_cls = I18nCall
+        vi_call_cls = VariableInterpolationCall
 
         # 转换matches为I18nCall对象
-        for result in results:
-            for match in result.matches:
-                call = I18nCall(key=match['key'], file_path=result.file_path, line_number=match.get('line', 0),
-                                column_number=match.get('column', 0), pattern=match.get('pattern'),
-                                context=match.get('context'))
-                i18n_calls.append(call)
-
-            # 转换variable_interpolation_matches为VariableInterpolationCall对象
-            if hasattr(result, 'variable_interpolation_matches'):
-                from .analyzer import VariableInterpolationCall
-                for vi_match in result.variable_interpolation_matches:
-                    vi_call = VariableInterpolationCall(
-                        key=vi_match['key'], 
-                        file_path=result.file_path, 
-                        line_number=vi_match.get('line', 0),
-                        column_number=vi_match.get('column', 0), 
-                        match_text=vi_match.get('match_text', ''),
-                        pattern=vi_match.get('pattern'),
-                        context=vi_match.get('context')
-                    )
-                    variable_interpolation_calls.append(vi_call)
+        i18n_calls = [
+            call_cls(key=match['key'], file_path=result.file_path, line_number=match.get('line', 0),
+                     column_number=match.get('column', 0), pattern=match.get('pattern'),
+                     context=match.get('context'))
+            for result in results for match in result.matches]
+
+        # 转换variable_interpolation_matches为VariableInterpolationCall对象
+        variable_interpolation_calls = [
+            vi_call_cls(key=vi_match['key'], file_path=result.file_path, line_number=vi_match.get('line', 0),
+                        column_number=vi_match.get('column', 0), match_text=vi_match.get('match_text', ''),
+                        pattern=vi_match.get('pattern'), context=vi_match.get('context'))
+            for result in results for vi_match in getattr(result, 'variable_interpolation_matches', ())]
 
         return cls(i18n_calls=i18n_calls, unique_keys=summary.unique_keys, total_files=summary.total_files,
                    total_calls=summary.total_matches, scan_results=results,
@@ -148,7 +157,12 @@ class FileScanner:
         scanned_count = 0
         error_count = 0
 
-        if self.config.max_threads > 1:
+        workers = min(self.config.max_threads, os.cpu_count() or 1)
+
+        if workers > 1 and len(files_to_scan) >= _PROCESS_POOL_MIN_FILES:
+            # 多进程扫描
+            scanned_count, error_count = self._scan_files_in_processes(files_to_scan, workers)
+        elif self.config.max_threads > 1:
             # 多线程扫描
             scanned_count, error_count = self._scan_files_threaded(files_to_scan)
         else:
@@ -157,11 +171,7 @@ class FileScanner:
 
         # 统计结果
         total_matches = sum(len(result.matches) for result in self.results)
-        unique_keys = set()
-
-        for result in self.results:
-            for match in result.matches:
-                unique_keys.add(match['key'])
+        unique_keys = {match['key'] for result in self.results for match in result.matches}
 
         scan_time = time.time() - start_time
 
@@ -181,19 +191,13 @@ class FileScanner:
 
     def get_all_keys(self) -> Set[str]:
         """获取所有发现的国际化键"""
-        keys = set()
-        for result in self.results:
-            for match in result.matches:
-                keys.add(match['key'])
-        return keys
+        return {match['key'] for result in self.results for match in result.matches}
 
     def get_keys_by_file(self) -> Dict[str, Set[str]]:
         """获取按文件分组的国际化键"""
         file_keys = {}
         for result in self.results:
-            keys = set()
-            for match in result.matches:
-                keys.add(match['key'])
+            keys = {match['key'] for match in result.matches}
             if keys:
                 file_keys[result.relative_path] = keys
         return file_keys
@@ -253,40 +257,66 @@ class FileScanner:
 
     def _scan_files_threaded(self, files: List[str]) -> tuple[int, int]:
         """多线程扫描文件"""
-        scanned_count = 0
-        error_count = 0
-        completed_count = 0
-
         with ThreadPoolExecutor(max_workers=self.config.max_threads) as executor:
-            # 提交所有任务
-            future_to_file = {executor.submit(self._scan_single_file, file_path): file_path for file_path in files}
+            results = self._collect_pool_results(executor, self._scan_single_file, files)
 
-            # 处理完成的任务
-            for future in as_completed(future_to_file):
-                if self._stop_event.is_set():
-                    # 取消所有未完成的任务
-                    for f in future_to_file:
-                        f.cancel()
-                    break
+        return self._store_pool_results(results)
+
+    def _scan_files_in_processes(self, files: List[str], workers: int) -> tuple[int, int]:
+        """
+        多进程扫描文件
 
-                completed_count += 1
-                file_path = future_to_file[future]
+        工作进程只接收文件路径和扫描参数，不传递扫描器对象本身；进程池不可用时回退到多线程扫描。
+        """
+        scan = partial(_scan_file, project_path=self.config.project_path, default_encoding=self.config.encoding,
+                       patterns=self.config.i18n_patterns)
+        # 按块分发路径，减少进程间往返次数，同时保留足够的块数用于负载均衡
+        chunksize = max(1, len(files) // (workers * 4))
 
-                if self.progress_callback:
-                    self.progress_callback(completed_count, len(files), file_path)
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = self._collect_pool_results(executor, scan, files, chunksize=chunksize)
+        except (OSError, BrokenProcessPool) as e:
+            logger.warning(f"进程池扫描失败，改用多线程扫描: {e}")
+            return self._scan_files_threaded(files)
+
+        # 结果从子进程反序列化而来，重新驻留键字符串，使跨文件的相同键再次共享同一对象
+        intern = sys.intern
+        for result in results:
+            for match in result.matches:
+                match['key'] = intern(match['key'])
+            for vi_match in result.variable_interpolation_matches:
+                vi_match['key'] = intern(vi_match['key'])
 
-                try:
-                    result = future.result()
-                    if result:
-                        if result.error:
-                            error_count += 1
-                        else:
-                            scanned_count += 1
-                        self.results.append(result)
+        return self._store_pool_results(results)
 
-                except Exception as e:
-                    logger.error(f"处理文件时出错 {file_path}: {e}")
-                    error_count += 1
+    def _collect_pool_results(self, executor: Executor, scan: Callable[[str], Optional[ScanResult]],
+                              files: List[str], chunksize: int = 1) -> List[ScanResult]:
+        """按文件顺序收集执行器的扫描结果，并报告进度"""
+        results = []
+
+        # executor.map 按提交顺序返回结果，扫描结果顺序与文件收集顺序一致
+        for completed_count, (file_path, result) in enumerate(
+                zip(files, executor.map(scan, files, chunksize=chunksize)), 1):
+            if self._stop_event.is_set():
+                # 取消所有未开始的任务
+                executor.shutdown(wait=False, cancel_futures=True)
+                break
+
+            if self.progress_callback:
+                self.progress_callback(completed_count, len(files), file_path)
+
+            if result:
+                results.append(result)
+
+        return results
+
+    def _store_pool_results(self, results: List[ScanResult]) -> tuple[int, int]:
+        """保存并发扫描的结果，返回 (成功数, 错误数)"""
+        # 计数在主线程中一次性汇总，工作线程之间不共享可变状态
+        self.results.extend(results)
+        error_count = sum(1 for result in results if result.error)
+        scanned_count = len(results) - error_count
 
         return scanned_count, error_count
 
@@ -300,46 +330,73 @@ class FileScanner:
         Returns:
             Optional[ScanResult]: 扫描结果，失败时返回None
         """
-        try:
-            # 读取文件内容
-            content, encoding = read_file_safe(file_path, self.config.encoding)
+        return _scan_file(file_path, self.config.project_path, self.config.encoding, self.config.i18n_patterns)
 
-            if content is None:
-                return ScanResult(file_path=file_path,
-                                  relative_path=get_relative_path(file_path, self.config.project_path), matches=[],
-                                  variable_interpolation_matches=[], encoding="", file_size=0, error="文件读取失败")
 
-            # 查找国际化调用
-            matches, variable_interpolation_matches = find_i18n_keys_in_text(content, self.config.i18n_patterns)
+def _scan_file(file_path: str, project_path: str, default_encoding: str, patterns: Optional[List[str]]) -> ScanResult:
+    """
+    扫描单个文件
 
-            # 添加文件路径信息到每个匹配项
-            for match in matches:
-                match['file_path'] = file_path
-                match['relative_path'] = get_relative_path(file_path, self.config.project_path)
+    定义为模块级函数，只依赖传入的参数，可以被序列化后在工作进程中执行。
 
-            # 添加文件路径信息到每个变量插值匹配项
-            for vi_match in variable_interpolation_matches:
-                vi_match['file_path'] = file_path
-                vi_match['relative_path'] = get_relative_path(file_path, self.config.project_path)
+    Args:
+        file_path: 文件路径
+        project_path: 项目根目录，用于计算相对路径
+        default_encoding: 首选文件编码
+        patterns: 国际化调用的正则模式列表
 
-            # 获取文件大小
-            file_size = os.path.getsize(file_path) if os.path.exists(file_path) else 0
+    Returns:
+        ScanResult: 扫描结果，失败时 error 字段记录原因
+    """
+    try:
+        # 读取文件内容
+        content, encoding = read_file_safe(file_path, default_encoding)
+
+        if content is None:
+            return ScanResult(file_path=file_path,
+                              relative_path=get_relative_path(file_path, project_path), matches=[],
+                              variable_interpolation_matches=[], encoding="", file_size=0, error="文件读取失败")
+
+        # 查找国际化调用
+        matches, variable_interpolation_matches = find_i18n_keys_in_text(content, patterns)
+
+        # 相对路径每个文件只计算一次，所有匹配项共享同一个字符串对象
+        relative_path = get_relative_path(file_path, project_path)
+
+        # 添加文件路径信息到每个匹配项
+        # 键字符串统一驻留（sys.intern），使后续集合/字典查找在CPython中可通过 `a is b` 指针比较快速命中
+        intern = sys.intern
+        for match in matches:
+            match['key'] = intern(match['key'])
+            match['file_path'] = file_path
+            match['relative_path'] = relative_path
+
+        # 添加文件路径信息到每个变量插值匹配项
+        for vi_match in variable_interpolation_matches:
+            vi_match['key'] = intern(vi_match['key'])
+            vi_match['file_path'] = file_path
+            vi_match['relative_path'] = relative_path
+
+        # 获取文件大小
+        try:
+            file_size = os.path.getsize(file_path)
+        except OSError:
+            file_size = 0
 
-            result = ScanResult(file_path=file_path,
-                                relative_path=get_relative_path(file_path, self.config.project_path), matches=matches,
-                                variable_interpolation_matches=variable_interpolation_matches, encoding=encoding,
-                                file_size=file_size)
+        result = ScanResult(file_path=file_path, relative_path=relative_path, matches=matches,
+                            variable_interpolation_matches=variable_interpolation_matches, encoding=encoding,
+                            file_size=file_size)
 
-            if matches or variable_interpolation_matches:
-                logger.debug(
-                    f"在文件 {result.relative_path} 中找到 {len(matches)} 个普通匹配项和 {len(variable_interpolation_matches)} 个变量插值匹配项")
+        if matches or variable_interpolation_matches:
+            logger.debug(
+                f"在文件 {result.relative_path} 中找到 {len(matches)} 个普通匹配项和 {len(variable_interpolation_matches)} 个变量插值匹配项")
 
-            return result
+        return result
 
-        except Exception as e:
-            logger.error(f"扫描文件失败 {file_path}: {e}")
-            return ScanResult(file_path=file_path, relative_path=get_relative_path(file_path, self.config.project_path),
-                              matches=[], variable_interpolation_matches=[], encoding="", file_size=0, error=str(e))
+    except Exception as e:
+        logger.error(f"扫描文件失败 {file_path}: {e}")
+        return ScanResult(file_path=file_path, relative_path=get_relative_path(file_path, project_path),
+                          matches=[], variable_interpolation_matches=[], encoding="", file_size=0, error=str(e))
 
 
 def scan_project(config=None, progress_callback=None) -> tuple[List[ScanResult], ScanSummary]:
@@ -49,6 +49,8 @@ class WelcomeWidget(QWidget):
         scroll_area.setWidgetResizable(True)
         scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        # 保留直接引用，避免外部通过 children() 遍历查找
+        self._scroll_area = scroll_area
 
         # 创建内容小部件
         content_widget = QWidget()
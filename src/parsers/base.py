@@ -5,6 +5,7 @@
 """
 
 import logging
+import sys
 from abc import ABC, abstractmethod
 from typing import Dict, Any, List, Optional, Set
 
@@ -164,21 +165,42 @@ class BaseParser(I18nParserInterface):
         if not isinstance(data, dict):
             return keys
 
-        for key, value in data.items():
-            if not isinstance(key, str):
-                continue
+        self._collect_flat_keys(data, prefix, keys)
 
-            full_key = f"{prefix}.{key}" if prefix else key
+        return keys
 
-            if isinstance(value, dict):
-                # 递归处理嵌套字典
-                nested_keys = self.flatten_keys(value, full_key)
-                keys.update(nested_keys)
-            else:
-                # 叶子节点
-                keys.add(full_key)
+    def _collect_flat_keys(self, data: Dict[str, Any], prefix: str, keys: Set[str]) -> None:
+        """
+        使用显式栈迭代收集叶子节点的键
 
-        return keys
+        每个字典的 "前缀." 只拼接一次，叶子处只需一次字符串连接，不再为每个叶子构造路径元组。
+        生成的键直接驻留（sys.intern），多个语言文件中的同名键共享同一对象。
+
+        Args:
+            data: 根字典
+            prefix: 根字典的键前缀
+            keys: 收集结果的集合
+        """
+        stack = [(data, prefix)]
+        # 热循环中使用的方法预先绑定为局部变量
+        stack_pop = stack.pop
+        stack_append = stack.append
+        keys_add = keys.add
+        intern = sys.intern
+        while stack:
+            node, node_prefix = stack_pop()
+            # 前缀为空时不产生前导点，与 f"{prefix}.{key}" 的旧行为一致
+            dotted_prefix = node_prefix + '.' if node_prefix else ''
+            for key, value in node.items():
+                if not isinstance(key, str):
+                    continue
+
+                if isinstance(value, dict):
+                    # 嵌套字典入栈
+                    stack_append((value, dotted_prefix + key))
+                else:
+                    # 叶子节点
+                    keys_add(intern(dotted_prefix + key))
 
     def extract_value(self, data: Dict[str, Any], key: str) -> Optional[Any]:
         """
@@ -23,6 +23,9 @@ class ParserFactory:
     # 文件扩展名到解析器的映射
     _extension_mapping: Dict[str, str] = {}
 
+    # 已创建的解析器实例，按类型共享（解析器不保存与单个文件相关的状态）
+    _instances: Dict[str, I18nParserInterface] = {}
+
     @classmethod
     def register(cls, parser_class: Type[I18nParserInterface], parser_name: str = None) -> None:
         """
@@ -39,10 +42,12 @@ class ParserFactory:
         name = parser_name or parser_class.__name__.lower().replace('i18nparser', '').replace('parser', '')
 
         cls._parsers[name] = parser_class
+        cls._instances.pop(name, None)
 
         # 更新扩展名映射
         try:
             parser_instance = parser_class()
+            cls._instances[name] = parser_instance
             supported_extensions = parser_instance.get_supported_extensions()
 
             for ext in supported_extensions:
@@ -57,6 +62,8 @@ class ParserFactory:
     def get_parser(cls, parser_type: str) -> Optional[I18nParserInterface]:
         """
         根据类型获取解析器实例
+
+        同一类型的解析器实例只创建一次，之后的调用直接返回缓存的实例。
         
         Args:
             parser_type: 解析器类型或文件扩展名
@@ -71,11 +78,17 @@ class ParserFactory:
                 logger.warning(f"未找到解析器类型: {parser_type}")
                 return None
 
-        parser_class = cls._parsers.get(parser_type.lower())
+        parser_type = parser_type.lower()
+        parser_instance = cls._instances.get(parser_type)
+        if parser_instance is not None:
+            return parser_instance
+
+        parser_class = cls._parsers.get(parser_type)
 
         if parser_class:
             try:
-                return parser_class()
+                # 多线程同时创建时以先写入的实例为准
+                return cls._instances.setdefault(parser_type, parser_class())
             except Exception as e:
                 logger.error(f"创建解析器实例失败 {parser_type}: {e}")
                 return None
@@ -163,6 +176,7 @@ class ParserFactory:
 
         # 移除解析器
         del cls._parsers[parser_type]
+        cls._instances.pop(parser_type, None)
 
         # 移除扩展名映射
         extensions_to_remove = [ext for ext, parser in cls._extension_mapping.items() if parser == parser_type]
@@ -178,6 +192,7 @@ class ParserFactory:
         """清除所有注册的解析器"""
         cls._parsers.clear()
         cls._extension_mapping.clear()
+        cls._instances.clear()
         logger.info("所有解析器已清除")
 
     @classmethod
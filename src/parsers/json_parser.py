@@ -4,12 +4,21 @@ JSON解析器
 实现JSON格式的国际化文件解析。
 """
 
+import codecs
 import json
 import logging
+import mmap
+import os
 from dataclasses import dataclass
-from typing import Dict, Any, List, Set
+from typing import Dict, Any, List, Optional, Set
 
 from .base import BaseParser, ParseError
+from ..utils.file_utils import MMAP_THRESHOLD, orjson_matches_json, to_native_newlines
+
+try:
+    import orjson  # 可选依赖，C实现的JSON解析，直接处理UTF-8字节
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
@@ -44,18 +53,21 @@ class JsonI18nParser(BaseParser):
             ParseError: 解析失败时抛出
         """
         try:
-            content = self._read_file(file_path)
+            data = self._load_json_fast(file_path) if orjson is not None else None
+
+            if data is None:
+                content = self._read_file(file_path)
+
+                if not content.strip():
+                    logger.warning(f"文件为空: {file_path}")
+                    raise ParseError("文件内容为空", file_path)
 
-            if not content.strip():
-                logger.warning(f"文件为空: {file_path}")
-                raise ParseError("文件内容为空", file_path)
-            else:
                 data = json.loads(content)
 
-                # 验证解析结果
-                validation_errors = self.validate_structure(data)
-                if validation_errors:
-                    raise ParseError(f"JSON结构验证失败: {', '.join(validation_errors)}", file_path)
+            # 验证解析结果
+            validation_errors = self.validate_structure(data)
+            if validation_errors:
+                raise ParseError(f"JSON结构验证失败: {', '.join(validation_errors)}", file_path)
 
             # Create result object with flattened keys
             keys = self.flatten_keys(data)
@@ -69,6 +81,37 @@ class JsonI18nParser(BaseParser):
         except Exception as e:
             raise ParseError(f"解析文件时出错: {str(e)}", file_path)
 
+    def _load_json_fast(self, file_path: str) -> Any:
+        """
+        使用orjson直接解析文件的原始字节
+
+        超过 ``MMAP_THRESHOLD`` 的文件通过mmap映射后直接交给orjson，不再先复制成bytes对象。
+        完整的数据树会保留在解析结果中供分析和优化使用，因此不采用 ijson 之类的流式解析：
+        峰值内存基本就是这棵树本身，流式解析省不下内存，速度却慢得多。
+
+        Args:
+            file_path: 文件路径
+
+        Returns:
+            Any: 解析后的数据；读取或解析失败时返回None，由标准库路径处理并给出原有的错误信息
+        """
+        try:
+            # 整个文件一次读完（或映射），不需要BufferedReader的缓冲区
+            with open(file_path, 'rb', buffering=0) as f:
+                if os.fstat(f.fileno()).st_size > MMAP_THRESHOLD:
+                    try:
+                        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    except (OSError, ValueError):
+                        # 无法映射的文件（如部分网络文件系统）退回普通读取
+                        mm = None
+                    if mm is not None:
+                        # 解析错误直接交给外层处理，不再重复解析
+                        with mm, memoryview(mm) as view:
+                            return orjson.loads(view)
+                return orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError):
+            return None
+
     def get_supported_extensions(self) -> List[str]:
         """
         返回支持的文件扩展名
@@ -93,7 +136,9 @@ class JsonI18nParser(BaseParser):
         try:
             from ..utils.file_utils import write_file_safe
 
-            content = json.dumps(data, indent=indent, ensure_ascii=False, sort_keys=True)
+            content = self._dump_json_bytes(data, indent)
+            if content is None:
+                content = json.dumps(data, indent=indent, ensure_ascii=False, sort_keys=True)
 
             success = write_file_safe(file_path, content, self.encoding)
 
@@ -108,6 +153,30 @@ class JsonI18nParser(BaseParser):
             logger.error(f"保存JSON文件时出错 {file_path}: {e}")
             return False
 
+    def _dump_json_bytes(self, data: Dict[str, Any], indent: int) -> Optional[bytes]:
+        """
+        使用orjson直接序列化为UTF-8字节，省去先生成str再编码的过程
+
+        换行符转换为平台换行符，结果与标准库json以文本模式写入的字节相同。
+
+        Args:
+            data: 要保存的数据
+            indent: 缩进空格数
+
+        Returns:
+            Optional[bytes]: 序列化结果；未安装orjson、缩进不是2、编码不是UTF-8，
+            或数据超出orjson支持范围、含有两者输出不同的值（如NaN）时返回None
+        """
+        if orjson is None or indent != 2 or codecs.lookup(self.encoding).name != 'utf-8':
+            return None
+        if not orjson_matches_json(data):
+            return None
+
+        try:
+            return to_native_newlines(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS))
+        except orjson.JSONEncodeError:
+            return None
+
     def validate_structure(self, data: Dict[str, Any]) -> List[str]:
         """
         验证JSON数据结构
@@ -5,13 +5,25 @@
 """
 
 import logging
+import mmap
 import os
-from typing import Optional, Tuple
+from dataclasses import fields, is_dataclass
+from typing import Any, Optional, Tuple, Union
 
 import chardet
 
 logger = logging.getLogger(__name__)
 
+# 超过该大小的文件通过mmap直接解码，省去先读入bytes对象再解码的一次拷贝
+MMAP_THRESHOLD = 64 * 1024
+
+# 文本模式写入时换行符会被转换为平台换行符，直接写字节时需要手动转换
+_NATIVE_NEWLINE = os.linesep.encode('ascii')
+
+# orjson 能序列化的整数范围（int64 最小值到 uint64 最大值）
+_ORJSON_INT_MIN = -2 ** 63
+_ORJSON_INT_MAX = 2 ** 64 - 1
+
 
 def detect_encoding(file_path: str) -> str:
     """
@@ -57,7 +69,10 @@ def read_file_safe(file_path: str, encoding: Optional[str] = None) -> Tuple[Opti
     Returns:
         Tuple[Optional[str], str]: (文件内容, 使用的编码)，如果读取失败返回(None, "")
     """
-    if not os.path.exists(file_path):
+    # 一次 stat 同时完成存在性检查和大小获取
+    try:
+        file_size = os.path.getsize(file_path)
+    except OSError:
         logger.error(f"文件不存在: {file_path}")
         return None, ""
 
@@ -65,6 +80,14 @@ def read_file_safe(file_path: str, encoding: Optional[str] = None) -> Tuple[Opti
         encoding = detect_encoding(file_path)
 
     try:
+        if file_size > MMAP_THRESHOLD:
+            with open(file_path, 'rb', buffering=0) as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                content = str(mm, encoding, 'ignore')
+            # 与文本模式读取一致，统一换行符
+            if '\r' in content:
+                content = content.replace('\r\n', '\n').replace('\r', '\n')
+            return content, encoding
+
         with open(file_path, 'r', encoding=encoding, errors='ignore') as f:
             content = f.read()
         return content, encoding
@@ -74,14 +97,14 @@ def read_file_safe(file_path: str, encoding: Optional[str] = None) -> Tuple[Opti
         return None, ""
 
 
-def write_file_safe(file_path: str, content: str, encoding: str = 'utf-8') -> bool:
+def write_file_safe(file_path: str, content: Union[str, bytes], encoding: str = 'utf-8') -> bool:
     """
     安全写入文件内容
     
     Args:
         file_path: 文件路径
-        content: 文件内容
-        encoding: 编码格式
+        content: 文件内容，bytes 视为已编码的内容原样写入
+        encoding: 编码格式（仅用于 str 内容）
         
     Returns:
         bool: 写入是否成功
@@ -90,8 +113,12 @@ def write_file_safe(file_path: str, content: str, encoding: str = 'utf-8') -> bo
         # 确保目录存在
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
 
-        with open(file_path, 'w', encoding=encoding) as f:
-            f.write(content)
+        if isinstance(content, bytes):
+            with open(file_path, 'wb') as f:
+                f.write(content)
+        else:
+            with open(file_path, 'w', encoding=encoding) as f:
+                f.write(content)
 
         logger.debug(f"文件写入成功: {file_path}")
         return True
@@ -101,6 +128,57 @@ def write_file_safe(file_path: str, content: str, encoding: str = 'utf-8') -> bo
         return False
 
 
+def to_native_newlines(content: bytes) -> bytes:
+    """
+    将JSON字节中的换行符转换为平台换行符，与文本模式写入的结果一致
+
+    orjson 只输出 LF；JSON字符串中的换行都会被转义，因此可以直接整体替换。
+
+    Args:
+        content: orjson 序列化得到的字节
+
+    Returns:
+        bytes: 换行符与文本模式写入一致的字节
+    """
+    if _NATIVE_NEWLINE == b'\n':
+        return content
+    return content.replace(b'\n', _NATIVE_NEWLINE)
+
+
+def orjson_matches_json(data: Any) -> bool:
+    """
+    检查数据经orjson序列化后是否与标准库json的输出一致
+
+    两者只在浮点数格式上有差异：NaN/Infinity 会被orjson输出为 null，
+    小于 1e-4 或不小于 1e16 的数两者的科学计数法写法不同；
+    此外orjson无法序列化超出64位范围的整数。
+
+    Args:
+        data: 要序列化的数据，可以包含dataclass对象
+
+    Returns:
+        bool: 不含上述浮点数和整数时返回True
+    """
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, str):
+            continue
+        if isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+        elif isinstance(value, float):
+            if not (value == 0 or 1e-4 <= abs(value) < 1e16):
+                return False
+        elif isinstance(value, int):
+            if not _ORJSON_INT_MIN <= value <= _ORJSON_INT_MAX:
+                return False
+        elif is_dataclass(value) and not isinstance(value, type):
+            stack.extend(getattr(value, field.name) for field in fields(value))
+    return True
+
+
 def ensure_dir(directory: str) -> bool:
     """
     确保目录存在，如果不存在则创建
@@ -146,7 +224,8 @@ def is_text_file(file_path: str) -> bool:
         bool: 是否为文本文件
     """
     try:
-        with open(file_path, 'rb') as f:
+        # 只读取开头一小段，无需分配读缓冲区
+        with open(file_path, 'rb', buffering=0) as f:
             chunk = f.read(1024)
 
         if not chunk:
@@ -7,7 +7,9 @@
 import glob
 import logging
 import os
-from typing import List, Generator, Optional, Tuple
+from typing import List, Generator, Optional, Tuple, FrozenSet, Callable
+
+from .pattern_utils import get_ignore_matcher
 
 logger = logging.getLogger(__name__)
 
@@ -61,38 +63,72 @@ def walk_directory(directory: str, file_extensions: Optional[List[str]] = None,
         logger.warning(f"目录不存在: {directory}")
         return
 
-    if ignore_patterns is None:
-        ignore_patterns = []
+    # 预先构建扩展名集合与忽略判断函数，遍历时每个条目只需一次集合查找和一次已编译正则匹配
+    extension_set = frozenset(file_extensions) if file_extensions else None
+    ignore_match = get_ignore_matcher(tuple(ignore_patterns)) if ignore_patterns else None
 
     # 标准化目录路径
     directory = normalize_path(directory)
+    base_prefix_len = len(directory) if directory.endswith(os.sep) else len(directory) + 1
+
+    yield from _scan_directory(directory, base_prefix_len, 0, extension_set, ignore_match, max_depth)
+
+
+def _scan_directory(current_dir: str, base_prefix_len: int, depth: int, extension_set: Optional[FrozenSet[str]],
+        ignore_match: Optional[Callable[[str], bool]], max_depth: Optional[int]) -> Generator[str, None, None]:
+    """
+    使用 os.scandir 递归遍历目录
+
+    DirEntry 在大多数平台上直接携带 readdir 返回的类型信息，判断文件/目录无需额外 stat。
+    遍历顺序与 os.walk 一致：先产出当前目录的文件，再依次进入子目录；符号链接目录不跟随。
+
+    Args:
+        current_dir: 当前遍历的目录
+        base_prefix_len: 根目录前缀（含分隔符）的长度，截取条目路径即得到相对路径
+        depth: 当前深度
+        extension_set: 允许的文件扩展名集合，None表示不限制
+        ignore_match: 判断相对路径是否应忽略的函数，None表示不忽略
+        max_depth: 最大遍历深度
+
+    Yields:
+        str: 文件路径
+    """
+    if max_depth is not None and depth >= max_depth:
+        return
+
+    try:
+        with os.scandir(current_dir) as it:
+            entries = list(it)
+    except OSError as e:
+        logger.debug(f"无法读取目录 {current_dir}: {e}")
+        return
 
-    for root, dirs, files in os.walk(directory):
-        # 计算当前深度
-        if max_depth is not None:
-            current_depth = root[len(directory):].count(os.sep)
-            if current_depth >= max_depth:
-                dirs.clear()  # 不再深入子目录
-                continue
+    sub_dirs = []
+
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
 
-        # 过滤要忽略的目录
-        dirs[:] = [d for d in dirs if not _should_ignore_dir(os.path.join(root, d), directory, ignore_patterns)]
+        if is_dir:
+            # 过滤要忽略的目录，符号链接目录与 os.walk 默认行为一致，不进入
+            if not entry.is_symlink() and not (ignore_match and ignore_match(entry.path[base_prefix_len:])):
+                sub_dirs.append(entry.path)
+            continue
 
-        # 处理文件
-        for file in files:
-            file_path = os.path.join(root, file)
+        # 检查文件扩展名
+        if extension_set is not None and os.path.splitext(entry.name)[1].lower() not in extension_set:
+            continue
 
-            # 检查是否应该忽略
-            if _should_ignore_file(file_path, directory, ignore_patterns):
-                continue
+        # 检查是否应该忽略
+        if ignore_match and ignore_match(entry.path[base_prefix_len:]):
+            continue
 
-            # 检查文件扩展名
-            if file_extensions:
-                file_ext = os.path.splitext(file)[1].lower()
-                if file_ext not in file_extensions:
-                    continue
+        yield entry.path
 
-            yield file_path
+    for sub_dir in sub_dirs:
+        yield from _scan_directory(sub_dir, base_prefix_len, depth + 1, extension_set, ignore_match, max_depth)
 
 
 def find_files_by_pattern(directory: str, pattern: str) -> List[str]:
@@ -127,14 +163,59 @@ def find_i18n_files(directory: str, extensions: List[str] = None) -> List[str]:
     if extensions is None:
         extensions = ['.json', '.yaml', '.yml']
 
-    i18n_files = []
+    if not os.path.exists(directory):
+        return []
+
+    # 一次遍历收集所有扩展名的文件，按扩展名分组后依次拼接，结果顺序与逐个扩展名执行 glob 时一致
+    suffixes = tuple(os.path.normcase(ext) for ext in extensions)
+    matches_by_suffix = [[] for _ in suffixes]
+    _collect_files_by_suffix(directory, suffixes, matches_by_suffix)
+
+    return [file_path for matches in matches_by_suffix for file_path in matches]
+
+
+def _collect_files_by_suffix(current_dir: str, suffixes: Tuple[str, ...], matches_by_suffix: List[List[str]]) -> None:
+    """
+    使用 os.scandir 递归收集以指定后缀结尾的文件
+
+    与 ``glob.glob("**/*<ext>", recursive=True)`` 的行为保持一致：跳过以点开头的隐藏文件和目录，
+    跟随符号链接目录，目录按先序遍历。
+
+    Args:
+        current_dir: 当前遍历的目录
+        suffixes: 经 normcase 处理的后缀元组
+        matches_by_suffix: 与后缀一一对应的结果列表
+    """
+    try:
+        with os.scandir(current_dir) as it:
+            entries = list(it)
+    except OSError as e:
+        logger.debug(f"无法读取目录 {current_dir}: {e}")
+        return
+
+    sub_dirs = []
+
+    for entry in entries:
+        name = entry.name
+        if name.startswith('.'):
+            continue
 
-    for ext in extensions:
-        pattern = f"**/*{ext}"
-        files = find_files_by_pattern(directory, pattern)
-        i18n_files.extend(files)
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+
+        if is_dir:
+            sub_dirs.append(entry.path)
+            continue
 
-    return i18n_files
+        name = os.path.normcase(name)
+        for index, suffix in enumerate(suffixes):
+            if name.endswith(suffix):
+                matches_by_suffix[index].append(entry.path)
+
+    for sub_dir in sub_dirs:
+        _collect_files_by_suffix(sub_dir, suffixes, matches_by_suffix)
 
 
 def get_directory_structure(directory: str, max_depth: int = 3) -> dict:
@@ -226,39 +307,3 @@ def split_file_path(file_path: str) -> Tuple[str, str, str]:
     name, extension = os.path.splitext(filename)
 
     return directory, name, extension
-
-
-def _should_ignore_dir(dir_path: str, base_path: str, ignore_patterns: List[str]) -> bool:
-    """
-    检查目录是否应该被忽略
-    
-    Args:
-        dir_path: 目录路径
-        base_path: 基础路径
-        ignore_patterns: 忽略模式列表
-        
-    Returns:
-        bool: 是否应该忽略
-    """
-    from .pattern_utils import should_ignore_path
-
-    relative_path = get_relative_path(dir_path, base_path)
-    return should_ignore_path(relative_path, ignore_patterns)
-
-
-def _should_ignore_file(file_path: str, base_path: str, ignore_patterns: List[str]) -> bool:
-    """
-    检查文件是否应该被忽略
-    
-    Args:
-        file_path: 文件路径
-        base_path: 基础路径
-        ignore_patterns: 忽略模式列表
-        
-    Returns:
-        bool: 是否应该忽略
-    """
-    from .pattern_utils import should_ignore_path
-
-    relative_path = get_relative_path(file_path, base_path)
-    return should_ignore_path(relative_path, ignore_patterns)
@@ -6,11 +6,30 @@
 
 import fnmatch
 import logging
+import os
 import re
-from typing import List, Pattern, Tuple, Optional, Dict, Any
+from functools import lru_cache
+from operator import itemgetter
+from typing import List, Pattern, Tuple, Optional, Dict, Any, FrozenSet, Callable
+
+try:
+    import ahocorasick  # 可选依赖 pyahocorasick，用于单次扫描定位所有锚点
+except ImportError:
+    ahocorasick = None
 
 logger = logging.getLogger(__name__)
 
+# 正则元字符，锚点提取遇到这些字符即停止
+_REGEX_METACHARS = frozenset('.^$*+?{}[]()|\\')
+_REGEX_QUANTIFIERS = frozenset('*+?{')
+
+# 锚点数量不超过该值时逐个用 ``in`` 查找（C实现的子串搜索）更快；
+# 自动机需要在Python层逐个处理 ``t``、``_`` 这类高频短锚点的每次出现
+_AUTOMATON_MIN_ANCHORS = 16
+
+# 变量插值模式：${variable}、#{variable}、{{variable}} 等
+_VARIABLE_INTERPOLATION_RE = re.compile(r'\$\{[^}]+\}|[#{][^}]*[}]')
+
 
 def find_i18n_keys_in_text(text: str, patterns: List[str] = None) -> tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
     """
@@ -27,21 +46,22 @@ def find_i18n_keys_in_text(text: str, patterns: List[str] = None) -> tuple[List[
     results = []
     variable_interpolation_results = []
 
-    # 使用改进的模式系统
-    if patterns:
-        # 编译传入的模式
-        compiled_patterns = []
-        for pattern_str in patterns:
-            try:
-                compiled_patterns.append(re.compile(pattern_str, re.DOTALL | re.MULTILINE))
-            except re.error as e:
-                logger.warning(f"无效的正则表达式模式 '{pattern_str}': {e}")
-    else:
-        # 使用内置的改进模式
-        compiled_patterns = _create_improved_patterns()
+    # 使用改进的模式系统，编译结果按模式元组缓存，避免每个文件重复编译
+    pattern_anchors = _compile_patterns(tuple(patterns) if patterns else tuple(get_default_i18n_patterns()))
+
+    # 先一次性找出文本中出现的锚点，锚点不存在的模式不可能匹配，直接跳过
+    present_anchors = _find_present_anchors(text, frozenset(anchor for _, anchor in pattern_anchors if anchor))
 
     # 对整个文本进行匹配，支持跨行
-    for pattern in compiled_patterns:
+    for pattern, anchor in pattern_anchors:
+        if anchor and anchor not in present_anchors:
+            continue
+
+        # finditer按位置递增返回匹配，行号和行首位置都只在与上一个匹配之间的区间内增量统计，
+        # 整体只扫描文本一遍（压缩后的单行大文件也不会对每个匹配回溯整行）
+        last_pos = 0
+        line_no = 1
+        line_start = 0
         for match in pattern.finditer(text):
             if match.groups() and len(match.groups()) >= 2:
                 key = match.group(2)  # 第二个捕获组是键（第一个是引号）
@@ -49,7 +69,12 @@ def find_i18n_keys_in_text(text: str, patterns: List[str] = None) -> tuple[List[
                 end = match.end()
 
                 # 计算行号和列号
-                line_no, col_no = _get_line_column_from_position(text, start)
+                newlines = text.count('\n', last_pos, start)
+                if newlines:
+                    line_no += newlines
+                    line_start = text.rfind('\n', last_pos, start) + 1
+                last_pos = start
+                col_no = start - line_start + 1
 
                 match_info = {'key': key, 'line': line_no, 'column': col_no, 'start': start, 'end': end,
                     'match_text': text[start:end]}
@@ -73,77 +98,240 @@ def find_i18n_keys_in_text(text: str, patterns: List[str] = None) -> tuple[List[
                 seen_positions.add(pos_key)
                 unique_results.append(result)
 
-        # 按行号和列号排序
-        unique_results.sort(key=lambda x: (x['line'], x['column']))
+        # 按行号和列号排序（同一文本中行列顺序与起始偏移顺序一致，直接按偏移排序）
+        unique_results.sort(key=itemgetter('start'))
         return unique_results
 
     return deduplicate_results(results), deduplicate_results(variable_interpolation_results)
 
 
-def _get_line_column_from_position(text: str, position: int) -> Tuple[int, int]:
+@lru_cache(maxsize=256)
+def get_pattern_anchor(pattern: str) -> Optional[str]:
     """
-    根据字符位置计算行号和列号
-    
+    提取正则模式开头必须出现的字面量锚点
+
+    例如 ``req\\.t\\s*\\(`` 的锚点为 ``req.t``。开头的后顾断言会被跳过；
+    含顶层 ``|`` 分支或无法确定字面量前缀的模式返回None，表示不做预筛选。
+
     Args:
-        text: 完整文本
-        position: 字符位置
-        
+        pattern: 正则表达式模式字符串
+
+    Returns:
+        Optional[str]: 锚点字符串，无法提取时返回None
+    """
+    prefix = _split_pattern_prefix(pattern)
+    return prefix[1] if prefix else None
+
+
+def _split_pattern_prefix(pattern: str) -> Optional[Tuple[Tuple[str, ...], str, str, str]]:
+    """
+    将正则模式拆分为开头的后顾断言、字面量前缀和剩余部分
+
+    Args:
+        pattern: 正则表达式模式字符串
+
+    Returns:
+        Optional[Tuple[Tuple[str, ...], str, str, str]]: (后顾断言源码, 字面量, 字面量源码, 剩余源码)，
+        含顶层分支或没有字面量前缀时返回None
+    """
+    # 顶层存在分支时任一分支都可能匹配，无法确定公共锚点
+    depth = 0
+    in_class = False
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == '\\':
+            i += 2
+            continue
+        if in_class:
+            if char == ']':
+                in_class = False
+        elif char == '[':
+            in_class = True
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == '|' and depth == 0:
+            return None
+        i += 1
+
+    # 跳过开头的后顾断言 (?<!...) / (?<=...)
+    lookbehinds = []
+    pos = 0
+    while pattern.startswith(('(?<!', '(?<='), pos):
+        depth = 0
+        in_class = False
+        i = pos
+        while i < len(pattern):
+            char = pattern[i]
+            if char == '\\':
+                i += 2
+                continue
+            if in_class:
+                if char == ']':
+                    in_class = False
+            elif char == '[':
+                in_class = True
+            elif char == '(':
+                depth += 1
+            elif char == ')':
+                depth -= 1
+                if depth == 0:
+                    break
+            i += 1
+        lookbehinds.append(pattern[pos:i + 1])
+        pos = i + 1
+
+    # 收集字面量前缀
+    literal = []
+    i = pos
+    while i < len(pattern):
+        char = pattern[i]
+        if char == '\\':
+            if i + 1 < len(pattern) and not pattern[i + 1].isalnum():
+                char = pattern[i + 1]
+                step = 2
+            else:
+                break
+        elif char in _REGEX_METACHARS:
+            break
+        else:
+            step = 1
+
+        # 后面跟量词时该字符是可选的，不能作为锚点的一部分
+        if i + step < len(pattern) and pattern[i + step] in _REGEX_QUANTIFIERS:
+            break
+
+        literal.append(char)
+        i += step
+
+    if not literal:
+        return None
+
+    return tuple(lookbehinds), ''.join(literal), pattern[pos:i], pattern[i:]
+
+
+def _hoist_leading_lookbehinds(pattern: str) -> str:
+    """
+    将开头的后顾断言移到字面量前缀之后
+
+    ``(?<!X)lit`` 与 ``lit(?<!(?:X)lit)`` 等价，但前者以断言开头，正则引擎只能在每个位置逐一尝试；
+    改写后模式以字面量开头，引擎可以先快速定位字面量再检查断言。
+
+    Args:
+        pattern: 正则表达式模式字符串
+
+    Returns:
+        str: 改写后的模式，无需或无法改写时原样返回
+    """
+    prefix = _split_pattern_prefix(pattern)
+    if not prefix or not prefix[0]:
+        return pattern
+
+    lookbehinds, _, literal_source, rest = prefix
+    hoisted = ''.join(f'{lookbehind[:4]}(?:{lookbehind[4:-1]}){literal_source})' for lookbehind in lookbehinds)
+    return literal_source + hoisted + rest
+
+
+@lru_cache(maxsize=32)
+def _build_anchor_automaton(anchors: FrozenSet[str]):
+    """构建锚点的Aho-Corasick自动机（按锚点集合缓存）"""
+    automaton = ahocorasick.Automaton()
+    for anchor in anchors:
+        automaton.add_word(anchor, anchor)
+    automaton.make_automaton()
+    return automaton
+
+
+def _find_present_anchors(text: str, anchors: FrozenSet[str]) -> FrozenSet[str]:
+    """
+    找出文本中出现过的锚点
+
+    锚点较多且安装了pyahocorasick时单次线性扫描即可定位全部锚点，否则逐个使用 ``in`` 检查。
+
+    Args:
+        text: 要搜索的文本
+        anchors: 锚点集合
+
     Returns:
-        Tuple[int, int]: (行号, 列号) - 1-based
+        FrozenSet[str]: 文本中出现过的锚点
     """
-    lines_before = text[:position].split('\n')
-    line_no = len(lines_before)
-    col_no = len(lines_before[-1]) + 1
-    return line_no, col_no
+    if not anchors:
+        return frozenset()
+
+    if ahocorasick is None or len(anchors) <= _AUTOMATON_MIN_ANCHORS:
+        return frozenset(anchor for anchor in anchors if anchor in text)
+
+    found = set()
+    for _, anchor in _build_anchor_automaton(anchors).iter(text):
+        found.add(anchor)
+        if len(found) == len(anchors):
+            break
+    return frozenset(found)
 
 
 def get_default_i18n_patterns() -> List[str]:
     """
     获取默认的国际化调用模式字符串列表
+
+    参数部分使用单字符分支 ``(?:[^()]|\\([^()]*\\))``，避免 ``(?:[^()]*|...)*`` 这类嵌套量词
+    在不匹配的行上产生大量回溯。
+
+    模式依赖反向引用 ``\\1`` 和否定前瞻 ``(?!...)`` 来匹配成对的引号，
+    re2、Hyperscan 等线性时间引擎不支持这些语法，因此仍使用标准库 ``re``。
+    Hyperscan 的预筛选模式（HS_FLAG_PREFILTER）虽然能编译这些模式，但只能判断哪些模式可能匹配，
+    键仍需 ``re`` 提取；实测相比锚点预筛选只快一到两成，且没有 Windows 版本，因此未采用。
     
     Returns:
         List[str]: 正则表达式模式字符串列表
     """
     return [# $t() with single/double quotes - 改进版本，支持复杂的参数结构
-        r'\$t\s*\(\s*([\'"])((?:(?!\1)[^\\]|\\.)*?)\1\s*(?:,(?:[^()]*|\([^()]*\))*?)?\s*\)',
+        r'\$t\s*\(\s*([\'"])((?:(?!\1)[^\\]|\\.)*?)\1\s*(?:,(?:[^()]|\([^()]*\))*?)?\s*\)',
         # $t() with backticks - will be filtered out later if contains ${} 
-        r'\$t\s*\(\s*(`)((?:(?!`)[^\\]|\\.)*?)`\s*(?:,(?:[^()]*|\([^()]*\))*?)?\s*\)', 
+        r'\$t\s*\(\s*(`)((?:(?!`)[^\\]|\\.)*?)`\s*(?:,(?:[^()]|\([^()]*\))*?)?\s*\)', 
         # 更强大的 $t() 模式，支持嵌套的对象参数和跨行
-        r'\$t\s*\(\s*([\'"])((?:(?!\1)[^\\]|\\.)*?)\1\s*(?:,\s*\{(?:[^{}]*|\{[^{}]*\})*\})?\s*\)',
+        r'\$t\s*\(\s*([\'"])((?:(?!\1)[^\\]|\\.)*?)\1\s*(?:,\s*\{(?:[^{}]|\{[^{}]*\})*\})?\s*\)',
         # req.t() with single/double quotes - 支持Express.js中的请求对象国际化调用
-        r'req\.t\s*\(\s*([\'"])((?:(?!\1)[^\\]|\\.)*?)\1\s*(?:,(?:[^()]*|\([^()]*\))*?)?\s*\)',
+        r'req\.t\s*\(\s*([\'"])((?:(?!\1)[^\\]|\\.)*?)\1\s*(?:,(?:[^()]|\([^()]*\))*?)?\s*\)',
         # req.t() with backticks - 支持变量插值
-        r'req\.t\s*\(\s*(`)((?:(?!`)[^\\]|\\.)*?)`\s*(?:,(?:[^()]*|\([^()]*\))*?)?\s*\)',
+        r'req\.t\s*\(\s*(`)((?:(?!`)[^\\]|\\.)*?)`\s*(?:,(?:[^()]|\([^()]*\))*?)?\s*\)',
         # req.t() with nested object parameters
-        r'req\.t\s*\(\s*([\'"])((?:(?!\1)[^\\]|\\.)*?)\1\s*(?:,\s*\{(?:[^{}]*|\{[^{}]*\})*\})?\s*\)',
+        r'req\.t\s*\(\s*([\'"])((?:(?!\1)[^\\]|\\.)*?)\1\s*(?:,\s*\{(?:[^{}]|\{[^{}]*\})*\})?\s*\)',
         # t() - 但前面不能是字母、$符号或点号
-        r'(?<![a-zA-Z$\.])t\s*\(\s*([\'"`])((?:(?!\1)[^\\]|\\.)*?)\1\s*(?:,(?:[^()]*|\([^()]*\))*?)?\s*\)',
+        r'(?<![a-zA-Z$\.])t\s*\(\s*([\'"`])((?:(?!\1)[^\\]|\\.)*?)\1\s*(?:,(?:[^()]|\([^()]*\))*?)?\s*\)',
         # i18n.t() - 支持单引号和双引号
-        r'i18n\.t\s*\(\s*([\'"`])((?:(?!\1)[^\\]|\\.)*?)\1\s*(?:,(?:[^()]*|\([^()]*\))*?)?\s*\)', 
+        r'i18n\.t\s*\(\s*([\'"`])((?:(?!\1)[^\\]|\\.)*?)\1\s*(?:,(?:[^()]|\([^()]*\))*?)?\s*\)', 
         # _() - 但前面不能是字母
-        r'(?<![a-zA-Z])_\s*\(\s*([\'"`])((?:(?!\1)[^\\]|\\.)*?)\1\s*(?:,(?:[^()]*|\([^()]*\))*?)?\s*\)', 
+        r'(?<![a-zA-Z])_\s*\(\s*([\'"`])((?:(?!\1)[^\\]|\\.)*?)\1\s*(?:,(?:[^()]|\([^()]*\))*?)?\s*\)', 
         # gettext()
-        r'gettext\s*\(\s*([\'"`])((?:(?!\1)[^\\]|\\.)*?)\1\s*(?:,(?:[^()]*|\([^()]*\))*?)?\s*\)', ]
+        r'gettext\s*\(\s*([\'"`])((?:(?!\1)[^\\]|\\.)*?)\1\s*(?:,(?:[^()]|\([^()]*\))*?)?\s*\)', ]
 
 
-def _create_improved_patterns() -> List[Pattern]:
+@lru_cache(maxsize=32)
+def _compile_patterns(patterns: Tuple[str, ...]) -> Tuple[Tuple[Pattern, Optional[str]], ...]:
     """
-    创建改进的正则表达式模式，更准确地匹配国际化调用
-    
+    编译正则模式并提取锚点，结果按模式元组缓存
+
+    Args:
+        patterns: 正则表达式模式字符串元组
+
     Returns:
-        List[Pattern]: 编译后的正则表达式模式列表
+        Tuple[Tuple[Pattern, Optional[str]], ...]: (编译后的模式, 锚点) 元组
     """
-    # 使用共享的模式字符串
-    pattern_strings = get_default_i18n_patterns()
-
     compiled_patterns = []
-    for pattern in pattern_strings:
+    for pattern in patterns:
         try:
-            compiled_patterns.append(re.compile(pattern, re.DOTALL | re.MULTILINE))
+            try:
+                compiled = re.compile(_hoist_leading_lookbehinds(pattern), re.DOTALL | re.MULTILINE)
+            except re.error:
+                # 改写后的模式无法编译时使用原模式
+                compiled = re.compile(pattern, re.DOTALL | re.MULTILINE)
+            compiled_patterns.append((compiled, get_pattern_anchor(pattern)))
         except re.error as e:
             logger.warning(f"无效的正则表达式模式 '{pattern}': {e}")
 
-    return compiled_patterns
+    return tuple(compiled_patterns)
 
 
 def _contains_variable_interpolation(key: str) -> bool:
@@ -156,13 +344,13 @@ def _contains_variable_interpolation(key: str) -> bool:
     Returns:
         bool: 是否包含变量插值
     """
-    # 检查是否包含 ${} 模式的变量插值
-    if re.search(r'\$\{[^}]+\}', key):
-        return True
+    # 所有插值形式都包含 { 或 #，普通键直接返回
+    if '{' not in key and '#' not in key:
+        return False
 
-    # 检查是否包含其他常见的变量插值模式
+    # 检查是否包含 ${} 模式的变量插值，以及其他常见的变量插值模式
     # 例如 #{variable} 或 {{variable}}
-    if re.search(r'[#{][^}]*[}]', key):
+    if _VARIABLE_INTERPOLATION_RE.search(key):
         return True
 
     # 检查是否包含未闭合的插值符号
@@ -183,24 +371,73 @@ def should_ignore_path(path: str, ignore_patterns: List[str]) -> bool:
     Returns:
         bool: 是否应该忽略
     """
-    # 标准化路径
-    normalized_path = path.replace('\\', '/')
+    matcher = get_ignore_matcher(tuple(ignore_patterns))
+    return matcher is not None and matcher(path)
 
-    for pattern in ignore_patterns:
-        # 标准化模式
-        normalized_pattern = pattern.replace('\\', '/')
 
-        # 支持glob模式匹配
-        if fnmatch.fnmatch(normalized_path, normalized_pattern):
+@lru_cache(maxsize=32)
+def get_ignore_matcher(ignore_patterns: Tuple[str, ...]) -> Optional[Callable[[str], bool]]:
+    """
+    获取判断路径是否应被忽略的函数
+
+    忽略模式只编译一次，遍历大量文件时直接调用返回的函数，省去逐个路径的缓存查找。
+
+    Args:
+        ignore_patterns: 忽略模式元组（支持glob模式）
+
+    Returns:
+        Optional[Callable[[str], bool]]: 判断函数，没有忽略模式时为None
+    """
+    if not ignore_patterns:
+        return None
+
+    glob_regex, dir_regex = _compile_ignore_patterns(ignore_patterns)
+    glob_match = glob_regex.match if glob_regex is not None else None
+    dir_match = dir_regex.match if dir_regex is not None else None
+    normcase = os.path.normcase
+
+    def matches(path: str) -> bool:
+        # 标准化路径
+        normalized_path = path.replace('\\', '/')
+
+        # 支持glob模式匹配（与 fnmatch.fnmatch 一样先做 normcase）
+        if glob_match is not None and glob_match(normcase(normalized_path)):
             return True
 
         # 支持目录匹配
+        return dir_match is not None and dir_match(normalized_path) is not None
+
+    return matches
+
+
+@lru_cache(maxsize=32)
+def _compile_ignore_patterns(ignore_patterns: Tuple[str, ...]) -> Tuple[Optional[Pattern], Optional[Pattern]]:
+    """
+    将忽略模式列表合并编译为两个正则
+
+    所有glob模式经 fnmatch.translate 转换后合并为一个交替式正则，
+    以 '/**' 结尾的模式另合并为一个目录前缀正则，每条路径只需两次匹配。
+
+    Args:
+        ignore_patterns: 忽略模式元组
+
+    Returns:
+        Tuple[Optional[Pattern], Optional[Pattern]]: (glob正则, 目录前缀正则)，没有对应模式时为None
+    """
+    glob_parts = []
+    dir_parts = []
+
+    for pattern in ignore_patterns:
+        # 标准化模式
+        normalized_pattern = pattern.replace('\\', '/')
+        glob_parts.append(fnmatch.translate(os.path.normcase(normalized_pattern)))
+
         if normalized_pattern.endswith('/**'):
-            dir_pattern = normalized_pattern[:-3]
-            if normalized_path.startswith(dir_pattern + '/') or normalized_path == dir_pattern:
-                return True
+            dir_parts.append(re.escape(normalized_pattern[:-3]) + r'(?:/|\Z)')
 
-    return False
+    glob_regex = re.compile('|'.join(glob_parts)) if glob_parts else None
+    dir_regex = re.compile('|'.join(dir_parts)) if dir_parts else None
+    return glob_regex, dir_regex
 
 
 def filter_files_by_extension(files: List[str], extensions: List[str]) -> List[str]:
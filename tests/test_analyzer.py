@@ -5,12 +5,65 @@
 import pytest
 from unittest.mock import Mock, patch
 
+try:
+    import pytest_benchmark  # 可选依赖，提供benchmark夹具
+except ImportError:
+    pytest_benchmark = None
+
 from src.core.analyzer import AnalysisEngine, AnalysisResult, MissingKey, UnusedKey, InconsistentKey
 from src.core.config import Config
 from src.core.scanner import ScanResult, I18nCall
 from src.core.parser import ParseResult, I18nFileInfo
 
 
+@pytest.fixture(scope="module")
+def large_scan():
+    """大数据集扫描结果（模块级共享，避免每轮基准测试重复构建）"""
+    large_scan_results = []
+    for i in range(100):
+        matches = [
+            {
+                'key': f'section{i}.key{j}',
+                'line': j,
+                'column': 10,
+                'context': f't("section{i}.key{j}")'
+            }
+            for j in range(50)
+        ]
+        large_scan_results.append(ScanResult(
+            file_path=f'/project/file{i}.js',
+            relative_path=f'file{i}.js',
+            matches=matches,
+            encoding='utf-8',
+            file_size=1024
+        ))
+    return large_scan_results
+
+
+@pytest.fixture(scope="module")
+def large_parse():
+    """大数据集解析结果"""
+    large_keys = {}
+    for i in range(100):
+        for j in range(45):  # 故意少一些，制造缺失键
+            large_keys[f'section{i}.key{j}'] = f'Value {i}-{j}'
+
+    return ParseResult(
+        files=[I18nFileInfo(
+            file_path='/project/i18n/en.json',
+            relative_path='en.json',
+            parser_type='json',
+            file_size=10240,
+            keys=set(large_keys.keys()),
+            data=large_keys
+        )],
+        total_keys=set(large_keys.keys()),
+        duplicate_keys={},
+        inconsistent_keys={},
+        parse_errors=[]
+    )
+
+
 class TestAnalysisEngine:
     """分析引擎测试"""
     
@@ -268,60 +321,14 @@ class TestAnalysisEngine:
         assert len(result.unused_keys) == 0
         assert len(result.inconsistent_keys) == 0
     
-    def test_performance_with_large_datasets(self):
+    @pytest.mark.skipif(pytest_benchmark is None, reason="未安装pytest-benchmark")
+    def test_performance_with_large_datasets(self, benchmark, large_scan, large_parse):
         """测试大数据集性能"""
-        # 创建大量的扫描结果
-        large_scan_results = []
-        for i in range(100):
-            matches = [
-                {
-                    'key': f'section{i}.key{j}',
-                    'line': j,
-                    'column': 10,
-                    'context': f't("section{i}.key{j}")'
-                }
-                for j in range(50)
-            ]
-            large_scan_results.append(ScanResult(
-                file_path=f'/project/file{i}.js',
-                relative_path=f'file{i}.js',
-                matches=matches,
-                encoding='utf-8',
-                file_size=1024
-            ))
-        
-        # 创建大量的解析结果
-        large_keys = {}
-        for i in range(100):
-            for j in range(45):  # 故意少一些，制造缺失键
-                large_keys[f'section{i}.key{j}'] = f'Value {i}-{j}'
-        
-        large_parse_result = ParseResult(
-            files=[I18nFileInfo(
-                file_path='/project/i18n/en.json',
-                relative_path='en.json',
-                parser_type='json',
-                file_size=10240,
-                keys=set(large_keys.keys()),
-                data=large_keys
-            )],
-            total_keys=set(large_keys.keys()),
-            duplicate_keys={},
-            inconsistent_keys={},
-            parse_errors=[]
-        )
-        
-        import time
-        start_time = time.time()
-        result = self.engine.analyze(large_scan_results, large_parse_result)
-        end_time = time.time()
-        
+        result = benchmark(self.engine.analyze, large_scan, large_parse)
+
         # 验证结果正确性
         assert len(result.missing_keys) > 0
         assert len(result.unused_keys) == 0  # 所有定义的键都被使用
-        
-        # 验证性能（应该在合理时间内完成）
-        assert (end_time - start_time) < 5.0  # 应该在5秒内完成
 
 
 class TestAnalysisResult:
@@ -384,6 +391,16 @@ class TestAnalysisDataStructures:
         assert missing_key.column_number == 25
         assert 'en.json' in missing_key.suggested_files
     
+    def test_missing_key_shares_suggested_files(self):
+        """测试建议文件转换为元组，传入同一个元组的缺失键共享该对象"""
+        first = MissingKey(key='a', file_path='a.js', line_number=1, column_number=1,
+                           suggested_files=['en.json', 'zh.json'])
+        second = MissingKey(key='b', file_path='b.js', line_number=2, column_number=1,
+                            suggested_files=first.suggested_files)
+        
+        assert first.suggested_files == ('en.json', 'zh.json')
+        assert first.suggested_files is second.suggested_files
+    
     def test_unused_key_creation(self):
         """测试未使用键创建"""
         unused_key = UnusedKey(
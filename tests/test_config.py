@@ -80,6 +80,26 @@ class TestConfigManager:
         assert loaded_config.i18n_path.endswith(os.path.join("test", "i18n"))
         assert loaded_config.max_threads == 8
     
+    def test_load_config_cache(self):
+        """测试重复加载未修改的配置文件时复用解析结果"""
+        self.config_manager.update_config(max_threads=6, file_extensions=['.js'])
+        assert self.config_manager.save_config(self.config_file)
+
+        with patch('src.core.config.json.load', wraps=json.load) as mock_load:
+            first = ConfigManager(self.config_file).load_config()
+            second = ConfigManager(self.config_file).load_config()
+
+        assert mock_load.call_count == 1
+        assert first.max_threads == second.max_threads == 6
+        # 各配置对象持有独立的列表，互不影响
+        first.file_extensions.append('.ts')
+        assert second.file_extensions == ['.js']
+
+        # 保存后重新读取最新内容
+        self.config_manager.update_config(max_threads=2)
+        assert self.config_manager.save_config(self.config_file)
+        assert ConfigManager(self.config_file).load_config().max_threads == 2
+
     def test_validate_config(self):
         """测试配置验证"""
         # 测试空配置的验证
@@ -117,6 +137,19 @@ class TestConfigManager:
         # 应该不会影响现有配置
         assert self.config_manager.config.max_threads == 16
     
+    def test_update_config_relative_path_follows_cwd(self, tmp_path, monkeypatch):
+        """测试相对路径的绝对化缓存随工作目录变化"""
+        for name in ('a', 'b'):
+            (tmp_path / name).mkdir()
+
+        monkeypatch.chdir(tmp_path / 'a')
+        self.config_manager.update_config(i18n_path='locales')
+        assert self.config_manager.config.i18n_path == str(tmp_path / 'a' / 'locales')
+
+        monkeypatch.chdir(tmp_path / 'b')
+        self.config_manager.update_config(i18n_path='locales')
+        assert self.config_manager.config.i18n_path == str(tmp_path / 'b' / 'locales')
+
     def test_reset_to_default(self):
         """测试重置为默认配置"""
         # 修改配置
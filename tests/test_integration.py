@@ -16,16 +16,147 @@ from src.core.analyzer import AnalysisEngine
 from src.core.reporter import ReportGenerator
 
 
+@pytest.fixture(scope="class")
+def project_skeleton(tmp_path_factory):
+    """创建示例项目文件模板，每个测试类只生成一次，测试按需复制"""
+    skeleton_dir = tmp_path_factory.mktemp('project_skeleton')
+    src_dir = skeleton_dir / 'src'
+    i18n_dir = skeleton_dir / 'i18n'
+    src_dir.mkdir()
+    i18n_dir.mkdir()
+
+    # 创建JavaScript文件
+    js_files = {
+        'main.js': '''
+            import { t } from './i18n';
+            
+            const title = t('common.title');
+            const saveButton = t('common.button.save');
+            const loginText = t('auth.login');
+            const missingKey = t('missing.key'); // 这个键在i18n中不存在
+            const dynamicKey = t(someVariable); // 动态键，不会被匹配
+        ''',
+        'App.vue': '''
+            <template>
+              <div>
+                <h1>{{ $t('common.title') }}</h1>
+                <p>{{ t('page.welcome') }}</p>
+                <button>{{ $t('common.button.save') }}</button>
+                <span>{{ t('another.missing') }}</span>
+              </div>
+            </template>
+            <script>
+            export default {
+              methods: {
+                showMessage() {
+                  this.$toast(this.$t('message.success'));
+                }
+              }
+            }
+            </script>
+        ''',
+        'utils.py': '''
+            from django.utils.translation import gettext as _
+            
+            def get_error_message():
+                return _('error.general')
+                
+            def get_welcome():
+                return _('common.welcome')
+        '''
+    }
+    
+    for filename, content in js_files.items():
+        (src_dir / filename).write_text(content, encoding='utf-8')
+
+    # 创建国际化文件
+    i18n_files = {
+        'en.json': {
+            "common": {
+                "title": "Application Title",
+                "welcome": "Welcome",
+                "button": {
+                    "save": "Save",
+                    "cancel": "Cancel",  # 未使用的键
+                    "submit": "Submit"   # 未使用的键
+                }
+            },
+            "auth": {
+                "login": "Login",
+                "logout": "Logout"  # 未使用的键
+            },
+            "page": {
+                "welcome": "Welcome to our application"
+            },
+            "message": {
+                "success": "Operation successful",
+                "error": "Operation failed"  # 未使用的键
+            },
+            "error": {
+                "general": "An error occurred"
+            },
+            "unused": {
+                "section": "This entire section is unused"
+            }
+        },
+        'zh.json': {
+            "common": {
+                "title": "应用标题",
+                "welcome": "欢迎",
+                "button": {
+                    "save": "保存",
+                    # 缺少 cancel 和 submit - 不一致
+                }
+            },
+            "auth": {
+                "login": "登录",
+                # 缺少 logout - 不一致
+            },
+            "page": {
+                "welcome": "欢迎使用我们的应用"
+            },
+            "message": {
+                "success": "操作成功"
+                # 缺少 error - 不一致
+            },
+            "error": {
+                "general": "发生错误"
+            }
+            # 完全缺少 unused 区域
+        },
+        'fr.json': {
+            "common": {
+                "title": "Titre de l'application",
+                "button": {
+                    "save": "Enregistrer"
+                }
+            },
+            "auth": {
+                "login": "Connexion"
+            }
+            # 缺少很多区域，测试大量不一致
+        }
+    }
+    
+    for filename, data in i18n_files.items():
+        with open(i18n_dir / filename, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+    return skeleton_dir
+
+
 class TestEndToEndIntegration:
     """端到端集成测试"""
     
-    def setup_method(self):
-        """测试前设置"""
-        self.temp_dir = tempfile.mkdtemp()
+    @pytest.fixture(autouse=True)
+    def setup_dirs(self, tmp_path, project_skeleton):
+        """测试前设置：每个测试使用独立的临时目录，由pytest统一清理"""
+        self.temp_dir = str(tmp_path)
         self.project_dir = os.path.join(self.temp_dir, 'test_project')
         self.i18n_dir = os.path.join(self.project_dir, 'i18n')
         self.src_dir = os.path.join(self.project_dir, 'src')
         self.output_dir = os.path.join(self.temp_dir, 'output')
+        self.project_skeleton = project_skeleton
         
         # 创建目录结构
         os.makedirs(self.project_dir)
@@ -40,126 +171,9 @@ class TestEndToEndIntegration:
         self.config.output_path = self.output_dir
     
     def create_test_project(self):
-        """创建测试项目结构"""
-        # 创建JavaScript文件
-        js_files = {
-            'main.js': '''
-                import { t } from './i18n';
-                
-                const title = t('common.title');
-                const saveButton = t('common.button.save');
-                const loginText = t('auth.login');
-                const missingKey = t('missing.key'); // 这个键在i18n中不存在
-                const dynamicKey = t(someVariable); // 动态键，不会被匹配
-            ''',
-            'App.vue': '''
-                <template>
-                  <div>
-                    <h1>{{ $t('common.title') }}</h1>
-                    <p>{{ t('page.welcome') }}</p>
-                    <button>{{ $t('common.button.save') }}</button>
-                    <span>{{ t('another.missing') }}</span>
-                  </div>
-                </template>
-                <script>
-                export default {
-                  methods: {
-                    showMessage() {
-                      this.$toast(this.$t('message.success'));
-                    }
-                  }
-                }
-                </script>
-            ''',
-            'utils.py': '''
-                from django.utils.translation import gettext as _
-                
-                def get_error_message():
-                    return _('error.general')
-                    
-                def get_welcome():
-                    return _('common.welcome')
-            '''
-        }
-        
-        for filename, content in js_files.items():
-            file_path = os.path.join(self.src_dir, filename)
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-        
-        # 创建国际化文件
-        i18n_files = {
-            'en.json': {
-                "common": {
-                    "title": "Application Title",
-                    "welcome": "Welcome",
-                    "button": {
-                        "save": "Save",
-                        "cancel": "Cancel",  # 未使用的键
-                        "submit": "Submit"   # 未使用的键
-                    }
-                },
-                "auth": {
-                    "login": "Login",
-                    "logout": "Logout"  # 未使用的键
-                },
-                "page": {
-                    "welcome": "Welcome to our application"
-                },
-                "message": {
-                    "success": "Operation successful",
-                    "error": "Operation failed"  # 未使用的键
-                },
-                "error": {
-                    "general": "An error occurred"
-                },
-                "unused": {
-                    "section": "This entire section is unused"
-                }
-            },
-            'zh.json': {
-                "common": {
-                    "title": "应用标题",
-                    "welcome": "欢迎",
-                    "button": {
-                        "save": "保存",
-                        # 缺少 cancel 和 submit - 不一致
-                    }
-                },
-                "auth": {
-                    "login": "登录",
-                    # 缺少 logout - 不一致
-                },
-                "page": {
-                    "welcome": "欢迎使用我们的应用"
-                },
-                "message": {
-                    "success": "操作成功"
-                    # 缺少 error - 不一致
-                },
-                "error": {
-                    "general": "发生错误"
-                }
-                # 完全缺少 unused 区域
-            },
-            'fr.json': {
-                "common": {
-                    "title": "Titre de l'application",
-                    "button": {
-                        "save": "Enregistrer"
-                    }
-                },
-                "auth": {
-                    "login": "Connexion"
-                }
-                # 缺少很多区域，测试大量不一致
-            }
-        }
-        
-        for filename, data in i18n_files.items():
-            file_path = os.path.join(self.i18n_dir, filename)
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+        """从示例项目模板复制测试项目文件"""
+        shutil.copytree(self.project_skeleton / 'src', self.src_dir, dirs_exist_ok=True)
+        shutil.copytree(self.project_skeleton / 'i18n', self.i18n_dir, dirs_exist_ok=True)
     
     def test_complete_analysis_workflow(self):
         """测试完整的分析工作流"""
@@ -258,6 +272,48 @@ class TestEndToEndIntegration:
                 # 优化文件应该移除未使用的键
                 assert 'unused.section' not in str(optimized_data)
     
+    def test_json_report_orjson_matches_json(self, monkeypatch):
+        """测试使用orjson与标准库json写出的JSON报告字节完全相同"""
+        from datetime import datetime
+        from src.core import reporter as reporter_module
+
+        if reporter_module.orjson is None:
+            pytest.skip("未安装orjson")
+
+        class FixedDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return cls(2024, 1, 1)
+
+        monkeypatch.setattr(reporter_module, 'datetime', FixedDatetime)
+        self.create_test_project()
+
+        scanner = FileScanner(self.config)
+        summary = scanner.scan_project()
+        project_scan_result = ProjectScanResult.from_summary_and_results(summary, scanner.get_results())
+        analysis_result = AnalysisEngine().analyze(project_scan_result, I18nFileParser(self.config).parse_directory())
+
+        reporter = ReportGenerator(self.config)
+        with open(reporter.generate_json_report(analysis_result), 'rb') as f:
+            fast_content = f.read()
+
+        monkeypatch.setattr(reporter_module, 'orjson', None)
+        with open(reporter.generate_json_report(analysis_result), 'rb') as f:
+            assert f.read() == fast_content
+
+    def test_json_report_with_wide_integer_value(self):
+        """测试值为超出64位范围的整数时JSON报告仍完整写出"""
+        from src.core.analyzer import AnalysisResult, UnusedKey
+
+        analysis_result = AnalysisResult(missing_keys=[], inconsistent_keys=[],
+                                         unused_keys=[UnusedKey(key='big.number', i18n_file='en.json', value=2 ** 70)])
+
+        reporter = ReportGenerator(self.config)
+        with open(reporter.generate_json_report(analysis_result), encoding='utf-8') as f:
+            report = json.load(f)
+
+        assert report['unused_keys'][0]['value'] == 2 ** 70
+
     def test_configuration_management(self):
         """测试配置管理"""
         config_manager = ConfigManager()
@@ -342,7 +398,7 @@ class TestEndToEndIntegration:
         
         large_i18n_file = os.path.join(self.i18n_dir, 'large.json')
         with open(large_i18n_file, 'w', encoding='utf-8') as f:
-            json.dump(large_i18n_data, f, indent=2)
+            json.dump(large_i18n_data, f, separators=(',', ':'), ensure_ascii=False)
         
         # 执行完整分析流程并测量时间
         import time
@@ -443,11 +499,6 @@ class TestEndToEndIntegration:
         # 验证未使用键被正确识别
         unused_key_names = [uk.key for uk in analysis_result.unused_keys]
         assert '中文.按钮.取消' in unused_key_names
-    
-    def teardown_method(self):
-        """测试后清理"""
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
 
 
 class TestGUIIntegration:
@@ -477,6 +528,7 @@ class TestGUIIntegration:
             assert hasattr(main_window, 'config_widget')
             assert hasattr(main_window, 'analysis_widget')
             assert hasattr(main_window, 'result_widget')
+            assert main_window.welcome_widget._scroll_area is not None
             
             app.quit()
             
@@ -8,6 +8,7 @@ import json
 import os
 from pathlib import Path
 
+from src.core import optimizer as optimizer_module
 from src.core.optimizer import I18nOptimizer, OptimizationResult
 from src.core.analyzer import AnalysisResult, MissingKey, UnusedKey
 from src.core.config import Config
@@ -15,6 +16,8 @@ from src.core.config import Config
 
 class MockParseResult:
     """模拟解析结果"""
+    __slots__ = ('file_path', 'data')
+
     def __init__(self, file_path: str, data: dict):
         self.file_path = file_path
         self.data = data
@@ -233,6 +236,35 @@ def test_optimize_file_data(config):
     assert optimized_data["used"]["key2"] == "value2"
 
 
+def test_optimize_file_data_replaces_removed_subtree(config):
+    """测试移除整个子树后再向同一路径添加键"""
+    optimizer = I18nOptimizer(config)
+
+    original_data = {"section": {"old": {"key": "value"}}, "kept": "value"}
+
+    optimized_data, removed_count, added_count = optimizer._optimize_file_data(
+        original_data, {"section.old"}, {"section.old.new_key": "", "kept.child": ""}
+    )
+
+    assert removed_count == 1
+    assert added_count == 1
+    assert optimized_data == {"section": {"old": {"new_key": ""}}, "kept": "value"}
+    # 原始数据不应被修改
+    assert original_data["section"]["old"] == {"key": "value"}
+
+
+def test_remove_subtree_keeps_node_index_in_sync(config):
+    """测试移除子树后索引只删除该子树下的节点，与重新建立的索引一致"""
+    optimizer = I18nOptimizer(config)
+    data = {"a": {"b": {"c": {"d": "1"}}, "bb": {"c": "2"}}, "a2": {"b": {"c": "3"}}}
+    node_index = optimizer._build_node_index(data)
+
+    assert optimizer._remove_nested_key(data, "a.b", node_index)
+    assert node_index == optimizer._build_node_index(data)
+    assert ("a", "bb") in node_index and ("a2", "b") in node_index
+    assert not optimizer._remove_nested_key(data, "a.b.c.d", node_index)
+
+
 def test_full_optimization(config, sample_analysis_result, sample_parse_result, temp_dir):
     """测试完整的优化流程"""
     # 创建原始文件
@@ -292,6 +324,68 @@ def test_full_optimization(config, sample_analysis_result, sample_parse_result,
     assert (session_path / "reports" / "optimization_report.txt").exists()
 
 
+def test_write_optimized_files_same_name(config, temp_dir):
+    """测试批量写入时同名文件按处理顺序由最后一个生效"""
+    files = []
+    for sub_dir in ("first", "second"):
+        os.makedirs(os.path.join(temp_dir, sub_dir))
+        file_path = os.path.join(temp_dir, sub_dir, "en.json")
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump({"source": sub_dir}, f)
+        files.append(file_path)
+
+    optimizer = I18nOptimizer(config)
+    optimizer._create_session_directory()
+    written = optimizer._write_optimized_files([(files[0], {"name": "第一"}), (files[1], {"name": "第二"})])
+
+    optimized_path, backup_path = written[files[1]]
+    assert written[files[0]] == (optimized_path, backup_path)
+    with open(optimized_path, encoding='utf-8') as f:
+        content = f.read()
+    assert content == json.dumps({"name": "第二"}, ensure_ascii=False, indent=2)
+    with open(backup_path, encoding='utf-8') as f:
+        assert json.load(f) == {"source": "second"}
+
+
+def test_write_skips_identical_content(config, temp_dir):
+    """测试重复写入相同内容时不改写已有的文件和备份"""
+    file_path = os.path.join(temp_dir, "en.json")
+    with open(file_path, 'w', encoding='utf-8') as f:
+        json.dump({"source": "en"}, f)
+
+    optimizer = I18nOptimizer(config)
+    optimizer._create_session_directory()
+    backup_path = optimizer._create_backup(file_path)
+    os.utime(backup_path, ns=(0, 0))
+    assert optimizer._create_backup(file_path) == backup_path
+    assert os.stat(backup_path).st_mtime_ns == 0
+
+    target = Path(temp_dir) / "out.json"
+    assert optimizer._write_bytes_if_changed(target, b'{}') is True
+    assert optimizer._write_bytes_if_changed(target, b'{}') is False
+    assert optimizer._write_bytes_if_changed(target, b'[]') is True
+    assert target.read_bytes() == b'[]'
+
+
+@pytest.mark.skipif(optimizer_module.orjson is None, reason="未安装orjson")
+@pytest.mark.parametrize('data', [
+    {"common": {"hello": "你好\n\"世界\"", "list": [1, 2.5, True, None, []], "empty": {}}},
+    {"ratio": float('nan'), "big": 1e16, "small": 1e-9},
+    {1: "整数键", "nested": {"a": "b"}},
+])
+def test_write_json_orjson_matches_json(config, temp_dir, monkeypatch, data):
+    """测试使用orjson与标准库json写出的JSON文件字节完全相同"""
+    optimizer = I18nOptimizer(config)
+    fast_path = Path(temp_dir) / "fast.json"
+    optimizer._write_json(fast_path, data)
+
+    monkeypatch.setattr(optimizer_module, 'orjson', None)
+    fallback_path = Path(temp_dir) / "fallback.json"
+    optimizer._write_json(fallback_path, data)
+
+    assert fast_path.read_bytes() == fallback_path.read_bytes()
+
+
 def test_no_optimization_no_directories(config, temp_dir):
     """测试当没有优化内容时不创建不必要的目录"""
     from src.core.analyzer import AnalysisResult, MissingKey, UnusedKey
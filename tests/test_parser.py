@@ -4,21 +4,39 @@ Parser模块测试
 
 import os
 import json
-import tempfile
 from unittest.mock import patch, mock_open
 
+import pytest
+
+try:
+    import orjson  # 可选依赖，用于快速生成测试文件
+except ImportError:
+    orjson = None
+
 from src.core.config import Config
 from src.core.parser import I18nFileParser, ParseResult, I18nFileInfo
+from src.parsers.base import ParseError
 from src.parsers.json_parser import JsonI18nParser
 from src.parsers.factory import ParserFactory
 
 
+def _write_json(file_path, data):
+    """以UTF-8写入缩进为2的JSON测试文件，内容与 json.dump(..., ensure_ascii=False, indent=2) 一致"""
+    if orjson is not None:
+        with open(file_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(data, ensure_ascii=False, indent=2))
+
+
 class TestI18nFileParser:
     """I18nFileParser 类测试"""
     
-    def setup_method(self):
-        """测试前设置"""
-        self.temp_dir = tempfile.mkdtemp()
+    @pytest.fixture(autouse=True)
+    def setup_dirs(self, tmp_path):
+        """测试前设置：每个测试使用独立的临时目录，由pytest统一清理"""
+        self.temp_dir = str(tmp_path)
         self.config = Config()
         self.config.i18n_path = self.temp_dir
         self.parser = I18nFileParser(self.config)
@@ -41,8 +59,7 @@ class TestI18nFileParser:
         }
         
         json_file = os.path.join(self.temp_dir, 'en.json')
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(test_data, f, indent=2)
+        _write_json(json_file, test_data)
         
         # 解析文件
         result = self.parser.parse_single_file(json_file)
@@ -82,8 +99,7 @@ class TestI18nFileParser:
         
         for filename, data in files_data.items():
             file_path = os.path.join(self.temp_dir, filename)
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
+            _write_json(file_path, data)
         
         # 设置i18n路径并解析
         self.config.i18n_path = self.temp_dir
@@ -101,6 +117,49 @@ class TestI18nFileParser:
         expected_keys = {'common.title', 'auth.login'}
         assert results.total_keys == expected_keys
     
+    def test_find_i18n_files_single_walk(self):
+        """测试单次遍历查找国际化文件：按扩展名分组、跳过隐藏目录"""
+        from src.utils.path_utils import find_i18n_files
+
+        os.makedirs(os.path.join(self.temp_dir, 'nested'))
+        os.makedirs(os.path.join(self.temp_dir, '.cache'))
+        for relative_path in ('en.yml', 'en.json', os.path.join('nested', 'zh.json'), os.path.join('.cache', 'fr.json')):
+            open(os.path.join(self.temp_dir, relative_path), 'w').close()
+
+        files = find_i18n_files(self.temp_dir, ['.json', '.yml'])
+
+        assert [os.path.relpath(f, self.temp_dir) for f in files] == ['en.json', os.path.join('nested', 'zh.json'),
+                                                                      'en.yml']
+
+    def test_parsed_keys_interned(self):
+        """测试不同文件中的同名键共享同一字符串对象"""
+        for filename in ('en.json', 'zh.json'):
+            _write_json(os.path.join(self.temp_dir, filename), {"common": {"title": filename}})
+
+        results = self.parser.parse_directory()
+
+        first, second = (next(iter(f.keys)) for f in results.files)
+        assert first == 'common.title'
+        assert first is second
+
+    def test_parse_directory_parallel_matches_sequential(self):
+        """测试多文件并行解析与顺序解析的结果一致"""
+        for i in range(8):
+            with open(os.path.join(self.temp_dir, f'lang{i}.json'), 'w', encoding='utf-8') as f:
+                json.dump({"common": {f"key{i}": "value"}}, f)
+        with open(os.path.join(self.temp_dir, 'broken.json'), 'w', encoding='utf-8') as f:
+            f.write('{"broken": ')
+
+        self.config.max_threads = 4
+        parallel = self.parser.parse_directory()
+        self.config.max_threads = 1
+        sequential = self.parser.parse_directory()
+
+        assert [f.file_path for f in parallel.files] == [f.file_path for f in sequential.files]
+        assert parallel.total_keys == sequential.total_keys == {f'common.key{i}' for i in range(8)}
+        assert parallel.parse_errors == sequential.parse_errors
+        assert len(parallel.parse_errors) == 1
+
     def test_parse_nested_structure(self):
         """测试嵌套结构解析"""
         nested_data = {
@@ -120,8 +179,7 @@ class TestI18nFileParser:
         }
         
         json_file = os.path.join(self.temp_dir, 'nested.json')
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(nested_data, f, indent=2)
+        _write_json(json_file, nested_data)
         
         result = self.parser.parse_single_file(json_file)
         
@@ -146,8 +204,7 @@ class TestI18nFileParser:
         }
         
         json_file = os.path.join(self.temp_dir, 'zh.json')
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(chinese_data, f, ensure_ascii=False, indent=2)
+        _write_json(json_file, chinese_data)
         
         result = self.parser.parse_single_file(json_file)
         
@@ -190,8 +247,7 @@ class TestI18nFileParser:
             }
         
         large_file = os.path.join(self.temp_dir, 'large.json')
-        with open(large_file, 'w', encoding='utf-8') as f:
-            json.dump(large_data, f, indent=2)
+        _write_json(large_file, large_data)
         
         import time
         start_time = time.time()
@@ -201,21 +257,16 @@ class TestI18nFileParser:
         assert result is not None
         assert len(result.keys) == 10000  # 1000 sections * 10 keys each
         assert (end_time - start_time) < 2.0  # 应该在2秒内完成
-    
-    def teardown_method(self):
-        """测试后清理"""
-        import shutil
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
 
 
 class TestJsonI18nParser:
     """JSON解析器测试"""
     
-    def setup_method(self):
-        """测试前设置"""
+    @pytest.fixture(autouse=True)
+    def setup_dirs(self, tmp_path):
+        """测试前设置：每个测试使用独立的临时目录，由pytest统一清理"""
         self.parser = JsonI18nParser()
-        self.temp_dir = tempfile.mkdtemp()
+        self.temp_dir = str(tmp_path)
     
     def test_flatten_keys(self):
         """测试键扁平化"""
@@ -243,6 +294,17 @@ class TestJsonI18nParser:
         
         assert result.keys == expected_keys
     
+    def test_flatten_keys_deep_nesting(self):
+        """测试嵌套层级超过递归深度限制时仍可扁平化"""
+        data = current = {}
+        for _ in range(5000):
+            current['n'] = {}
+            current = current['n']
+        current['leaf'] = 'value'
+        
+        assert self.parser.flatten_keys(data) == {'.'.join(['n'] * 5000 + ['leaf'])}
+        assert self.parser.flatten_keys({'a': 1}, prefix='root') == {'root.a'}
+    
     def test_get_supported_extensions(self):
         """测试支持的文件扩展名"""
         extensions = self.parser.get_supported_extensions()
@@ -260,12 +322,56 @@ class TestJsonI18nParser:
         
         assert result is not None
         assert 'test.key' in result.keys
-    
-    def teardown_method(self):
-        """测试后清理"""
-        import shutil
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
+
+    def test_save_json(self):
+        """测试保存JSON文件：UTF-8直接输出、键排序，与标准库格式一致"""
+        test_data = {"title": "标题", "common": {"save": "保存", "cancel": "取消"}}
+        test_file = os.path.join(self.temp_dir, 'out', 'zh.json')
+
+        assert self.parser.save(test_data, test_file)
+
+        with open(test_file, 'rb') as f:
+            content = f.read()
+        assert content == json.dumps(test_data, indent=2, ensure_ascii=False, sort_keys=True).encode('utf-8')
+
+    @pytest.mark.skipif(orjson is None, reason="未安装orjson")
+    def test_invalid_large_json_decoded_once_by_orjson(self, monkeypatch):
+        """测试超过mmap阈值的无效JSON文件只交给orjson解析一次"""
+        from src.parsers import json_parser
+
+        test_file = os.path.join(self.temp_dir, 'broken.json')
+        entries = ',\n'.join(f'  "key{i}": "{"x" * 50}"' for i in range(2000))
+        with open(test_file, 'w', encoding='utf-8') as f:
+            f.write('{\n' + entries + ',\n}')
+
+        calls = []
+        original_loads = orjson.loads
+
+        def counting_loads(data):
+            calls.append(len(data))
+            return original_loads(data)
+
+        monkeypatch.setattr(json_parser.orjson, 'loads', counting_loads)
+
+        with pytest.raises(ParseError):
+            self.parser.parse(test_file)
+        assert len(calls) == 1
+
+    @pytest.mark.skipif(orjson is None, reason="未安装orjson")
+    def test_save_json_orjson_matches_json(self, monkeypatch):
+        """测试使用orjson与标准库json保存的文件字节完全相同"""
+        from src.parsers import json_parser
+
+        test_data = {"b": {"text": "第一行\n第二行"}, "a": [1, 0.5], "ratio": float('nan'), "tiny": 1e-9}
+        fast_file = os.path.join(self.temp_dir, 'fast.json')
+        assert self.parser.save(test_data, fast_file)
+
+        monkeypatch.setattr(json_parser, 'orjson', None)
+        fallback_file = os.path.join(self.temp_dir, 'fallback.json')
+        assert self.parser.save(test_data, fallback_file)
+
+        with open(fast_file, 'rb') as fast, open(fallback_file, 'rb') as fallback:
+            assert fast.read() == fallback.read()
 
 
 class TestParserFactory:
@@ -279,6 +385,9 @@ class TestParserFactory:
         # 测试不支持的扩展名
         unknown_parser = ParserFactory.get_parser('.unknown')
         assert unknown_parser is None
+
+        # 同一类型的解析器实例被复用
+        assert ParserFactory.get_parser('json') is json_parser
     
     def test_get_supported_extensions(self):
         """测试获取支持的扩展名"""
@@ -350,6 +459,8 @@ class TestParseResult:
         assert 'key1' in all_keys
         assert 'key2' in all_keys
         assert 'key3' in all_keys
+        # 重复访问复用首次计算的结果
+        assert result.all_keys is all_keys
     
     def test_get_value(self):
         """测试获取键值"""
@@ -393,4 +504,5 @@ class TestParseResult:
         )
         
         assert 'existing.key' in result.total_keys
-        assert 'nonexistent.key' not in result.total_keys 
\ No newline at end of file
+        assert 'nonexistent.key' not in result.total_keys
+        assert isinstance(result.total_keys, frozenset) 
\ No newline at end of file
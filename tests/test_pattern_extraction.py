@@ -1,112 +1,147 @@
-# !/usr/bin/env python3
 """
 测试国际化键提取功能
 """
 
-import os
-import sys
+import re
 
-# 添加项目根目录到路径中
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+import pytest
 
-from src.utils.pattern_utils import find_i18n_keys_in_text
+from src.utils import pattern_utils
+from src.utils.pattern_utils import find_i18n_keys_in_text, get_pattern_anchor, get_default_i18n_patterns
+from src.utils.pattern_utils import _hoist_leading_lookbehinds
 
 
 def test_extraction():
     """测试从复杂的 $t() 调用中提取国际化键"""
 
     # 测试用例
-    test_text = """{{ $t('generation.currentAttempt', { 
-  current: generationsStore.generationProgress.currentAttempt, 
-  max: generationsStore.generationProgress.maxRetries 
+    test_text = """{{ $t('generation.currentAttempt', {
+  current: generationsStore.generationProgress.currentAttempt,
+  max: generationsStore.generationProgress.maxRetries
 }) }}"""
 
-    print("测试文本:")
-    print(test_text)
-    print("\n" + "=" * 50)
-
     # 调用提取函数
     results, variable_interpolation_results = find_i18n_keys_in_text(test_text)
 
-    print(f"提取结果数量: {len(results)}")
-    print("-" * 30)
-
-    for i, result in enumerate(results, 1):
-        print(f"结果 {i}:")
-        print(f"  键: '{result['key']}'")
-        print(f"  行号: {result['line']}")
-        print(f"  列号: {result['column']}")
-        print(f"  匹配文本: '{result['match_text']}'")
-        print(f"  开始位置: {result['start']}")
-        print(f"  结束位置: {result['end']}")
-        print()
-
     # 验证是否正确提取了目标键
-    expected_key = 'generation.currentAttempt'
     found_keys = [result['key'] for result in results]
+    assert found_keys == ['generation.currentAttempt']
+    assert not variable_interpolation_results
 
-    print("验证结果:")
-    if expected_key in found_keys:
-        print(f"✅ 成功提取目标键: '{expected_key}'")
-    else:
-        print(f"❌ 未能提取目标键: '{expected_key}'")
-        print(f"实际提取的键: {found_keys}")
+    result = results[0]
+    assert result['line'] == 1
+    assert result['column'] == 4
+    assert result['match_text'] == test_text[result['start']:result['end']]
 
-    return results
 
+def test_line_column_multiple_matches():
+    """测试同一行和跨行的多个匹配的行列号"""
+    text = "$t('a') + $t('b')\nx\n  $t('c'); $t('d')"
+    results, _ = find_i18n_keys_in_text(text)
 
-def test_additional_cases():
-    """测试其他复杂情况"""
+    assert [(r['key'], r['line'], r['column']) for r in results] == [
+        ('a', 1, 1), ('b', 1, 11), ('c', 3, 3), ('d', 3, 12)]
 
-    test_cases = [# 单行简单情况
-        "$t('simple.key')",
 
-        # 多行复杂参数
-        """$t('complex.key', {
+@pytest.mark.parametrize('test_case, expected_keys, expected_vi_keys', [
+    # 单行简单情况
+    ("$t('simple.key')", ['simple.key'], []),
+
+    # 多行复杂参数
+    ("""$t('complex.key', {
     param1: value1,
     param2: value2
-})""",
+})""", ['complex.key'], []),
 
-        # 嵌套在Vue模板中
-        """<div>{{ $t('nested.key', { count: items.length }) }}</div>""",
+    # 嵌套在Vue模板中
+    ("""<div>{{ $t('nested.key', { count: items.length }) }}</div>""", ['nested.key'], []),
 
-        # 多个键在同一文本中
-        """
+    # 多个键在同一文本中
+    ("""
         $t('first.key')
         $t('second.key', { param: value })
-        """,
+        """, ['first.key', 'second.key'], []),
+
+    # 包含变量插值的键（应该被过滤掉）
+    ("$t(`dynamic.${variable}.key`)", [], ['dynamic.${variable}.key']),
+])
+def test_additional_cases(test_case, expected_keys, expected_vi_keys):
+    """测试其他复杂情况"""
+    results, variable_interpolation_results = find_i18n_keys_in_text(test_case)
+
+    assert [result['key'] for result in results] == expected_keys
+    assert [result['key'] for result in variable_interpolation_results] == expected_vi_keys
+
+
+def test_pattern_anchors():
+    """测试从正则模式中提取字面量锚点"""
+    anchors = [get_pattern_anchor(pattern) for pattern in get_default_i18n_patterns()]
+    assert anchors == ['$t', '$t', '$t', 'req.t', 'req.t', 'req.t', 't', 'i18n.t', '_', 'gettext']
+
+    # 无法确定锚点的模式不做预筛选
+    assert get_pattern_anchor(r'foo|bar') is None
+    assert get_pattern_anchor(r'(?i)foo') is None
+    assert get_pattern_anchor(r'\w+') is None
+    # 量词修饰的字符是可选的
+    assert get_pattern_anchor(r'ab?c') == 'a'
+
+
+def test_hoist_leading_lookbehinds():
+    """测试开头的后顾断言被移到字面量之后且匹配结果不变"""
+    assert _hoist_leading_lookbehinds(r'(?<![a-zA-Z])_\s*\(') == r'_(?<!(?:[a-zA-Z])_)\s*\('
+    # 没有后顾断言或无法确定字面量前缀时原样返回
+    assert _hoist_leading_lookbehinds(r'req\.t\s*\(') == r'req\.t\s*\('
+    assert _hoist_leading_lookbehinds(r'(?<!a)\w+') == r'(?<!a)\w+'
+
+    text = "t('a.b') $t('c.d') at('e') obj.t('f') gettext_('g') _('h') x_('i')\n_(`j`)"
+    for pattern in get_default_i18n_patterns():
+        original = re.compile(pattern, re.DOTALL | re.MULTILINE)
+        hoisted = re.compile(_hoist_leading_lookbehinds(pattern), re.DOTALL | re.MULTILINE)
+        assert [(m.span(), m.groups()) for m in original.finditer(text)] == \
+               [(m.span(), m.groups()) for m in hoisted.finditer(text)]
+
+
+@pytest.mark.skipif(pattern_utils.ahocorasick is None, reason="未安装pyahocorasick")
+def test_anchor_prefilter_with_automaton(monkeypatch):
+    """测试锚点较多时使用自动机预筛选的结果与逐个查找一致"""
+    text = "req.t('server.error')\n$t('client.title')\ngettext('legacy.msg')"
+    anchors = frozenset(['req.t', '$t', 'gettext', 'i18n.t', '_', 'missing'])
+    expected = pattern_utils._find_present_anchors(text, anchors)
 
-        # 包含变量插值的键（应该被过滤掉）
-        "$t(`dynamic.${variable}.key`)", ]
+    monkeypatch.setattr(pattern_utils, '_AUTOMATON_MIN_ANCHORS', 0)
 
-    print("\n" + "=" * 60)
-    print("额外测试用例:")
-    print("=" * 60)
+    assert pattern_utils._find_present_anchors(text, anchors) == expected == {'req.t', '$t', 'gettext'}
 
-    for i, test_case in enumerate(test_cases, 1):
-        print(f"\n测试用例 {i}:")
-        print(f"文本: {repr(test_case)}")
 
-        results, variable_interpolation_results = find_i18n_keys_in_text(test_case)
-        extracted_keys = [result['key'] for result in results]
+def test_anchor_prefilter_without_automaton(monkeypatch):
+    """测试未安装pyahocorasick时的回退路径结果一致"""
+    text = "req.t('server.error')\n$t('client.title')\ngettext('legacy.msg')"
+    expected, _ = find_i18n_keys_in_text(text)
 
-        # 如果有变量插值结果，也显示出来
-        if variable_interpolation_results:
-            vi_keys = [result['key'] for result in variable_interpolation_results]
-            print(f"变量插值键: {vi_keys}")
+    monkeypatch.setattr(pattern_utils, 'ahocorasick', None)
+    results, _ = find_i18n_keys_in_text(text)
 
-        print(f"提取的键: {extracted_keys}")
+    assert [r['key'] for r in results] == [r['key'] for r in expected]
+    assert {'server.error', 'client.title', 'legacy.msg'} <= {r['key'] for r in results}
 
 
-if __name__ == "__main__":
-    print("开始测试国际化键提取功能...")
-    print("=" * 60)
+@pytest.mark.skipif(pattern_utils.ahocorasick is None, reason="未安装pyahocorasick")
+def test_many_custom_patterns_use_automaton(monkeypatch):
+    """测试自定义模式的锚点超过阈值时走自动机预筛选，匹配结果与逐个查找一致"""
+    patterns = [rf"(?<![a-zA-Z])fn{i}\s*\(\s*(['\"])([^'\"]+)\1" for i in range(20)]
+    assert len({get_pattern_anchor(pattern) for pattern in patterns}) > pattern_utils._AUTOMATON_MIN_ANCHORS
+    text = "fn3('a.b')\nfn17(\"c.d\") fn3('e')\nfn12(`skip`) xfn5('no') fn19('g.${id}')"
 
-    # 主要测试
-    results = test_extraction()
+    built = []
+    build_automaton = pattern_utils._build_anchor_automaton
+    monkeypatch.setattr(pattern_utils, '_build_anchor_automaton',
+                        lambda anchors: built.append(anchors) or build_automaton(anchors))
+    with_automaton = find_i18n_keys_in_text(text, patterns)
+    assert built
 
-    # 额外测试
-    test_additional_cases()
+    monkeypatch.setattr(pattern_utils, 'ahocorasick', None)
+    without_automaton = find_i18n_keys_in_text(text, patterns)
 
-    print("\n" + "=" * 60)
-    print("测试完成!")
+    assert with_automaton == without_automaton
+    assert [r['key'] for r in with_automaton[0]] == ['a.b', 'c.d', 'e']
+    assert [r['key'] for r in with_automaton[1]] == ['g.${id}']
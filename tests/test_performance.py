@@ -4,26 +4,114 @@
 
 import json
 import os
-import shutil
-import tempfile
+import sys
 import threading
 import time
 from unittest.mock import patch
 
 import pytest
+
+try:
+    import orjson  # 可选依赖，加快大型测试数据的生成
+except ImportError:
+    orjson = None
+
 from src.core.analyzer import AnalysisEngine
 from src.core.config import Config
 from src.core.parser import I18nFileParser, ParseResult, I18nFileInfo
 from src.core.reporter import ReportGenerator
 from src.core.scanner import FileScanner, I18nCall, ScanResult
 
+# 本模块的测试均为性能测试，可用 `-m perf` 单独选择或 `-m "not perf"` 排除
+pytestmark = pytest.mark.perf
+
+
+def _current_rss_mb():
+    """
+    当前进程的常驻内存（MB）
+
+    Linux 上直接读取 /proc/self/statm，不依赖 psutil；其他平台使用 psutil。
+    resource.getrusage 的 ru_maxrss 是进程生命周期内的峰值，无法反映增长和释放，因此不使用。
+    """
+    try:
+        with open('/proc/self/statm', 'rb') as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf('SC_PAGE_SIZE') / 1024 / 1024
+    except (OSError, ValueError, AttributeError):
+        import psutil
+        return psutil.Process().memory_info().rss / 1024 / 1024
+
+
+def _write_json(file_path, data):
+    """写入紧凑格式的JSON测试数据，整个文件一次序列化、一次写入"""
+    if orjson is not None:
+        content = orjson.dumps(data)
+    else:
+        content = json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    with open(file_path, 'wb') as f:
+        f.write(content)
+
+
+def _build_large_project(root, num_files, keys_per_file):
+    """在root下创建大型测试项目（project源码目录和i18n目录）"""
+    project_path = os.path.join(root, 'project')
+    i18n_path = os.path.join(root, 'i18n')
+    os.makedirs(project_path)
+    os.makedirs(i18n_path)
+
+    # 创建大量源代码文件
+    for i in range(num_files):
+        file_content = []
+        for j in range(keys_per_file):
+            if i % 3 == 0:  # JavaScript
+                file_content.append(f"const text{j} = t('section{i}.key{j}');")
+            elif i % 3 == 1:  # Vue
+                file_content.append(f"<div>{{{{ $t('section{i}.key{j}') }}}}</div>")
+            else:  # Python
+                file_content.append(f"text{j} = _('section{i}.key{j}')")
+
+        ext = ['.js', '.vue', '.py'][i % 3]
+        file_path = os.path.join(project_path, f'file{i}{ext}')
+        with open(file_path, 'wb') as f:
+            f.write('\n'.join(file_content).encode('utf-8'))
+
+    # 创建大型国际化文件
+    large_i18n_data = {}
+    for i in range(num_files):
+        section_data = {}
+        for j in range(int(keys_per_file * 0.8)):  # 80%的键存在，20%缺失
+            section_data[f'key{j}'] = f'Value {i}-{j}'
+        large_i18n_data[f'section{i}'] = section_data
+
+    i18n_file = os.path.join(i18n_path, 'en.json')
+    _write_json(i18n_file, large_i18n_data)
+
+    return project_path, i18n_path, (num_files * keys_per_file, len(large_i18n_data))
+
+
+@pytest.fixture(scope='session')
+def large_project(tmp_path_factory):
+    """按 (文件数, 每文件键数) 缓存的只读大型测试项目，整个测试会话内同一规模只创建一次"""
+    projects = {}
+
+    def get_project(num_files, keys_per_file):
+        key = (num_files, keys_per_file)
+        if key not in projects:
+            root = tmp_path_factory.mktemp(f'large_project_{num_files}_{keys_per_file}')
+            projects[key] = _build_large_project(str(root), num_files, keys_per_file)
+        return projects[key]
+
+    return get_project
+
 
 class TestPerformanceBenchmarks:
     """性能基准测试"""
 
-    def setup_method(self):
-        """测试前设置"""
-        self.temp_dir = tempfile.mkdtemp()
+    @pytest.fixture(autouse=True)
+    def setup_dirs(self, tmp_path, large_project):
+        """测试前设置：每个测试使用独立的临时目录，由pytest统一清理"""
+        self.temp_dir = str(tmp_path)
+        self.large_project = large_project
         self.config = Config()
         self.config.project_path = os.path.join(self.temp_dir, 'project')
         self.config.i18n_path = os.path.join(self.temp_dir, 'i18n')
@@ -34,36 +122,11 @@ class TestPerformanceBenchmarks:
         os.makedirs(self.config.output_path)
 
     def create_large_project(self, num_files=1000, keys_per_file=50):
-        """创建大型测试项目"""
-        # 创建大量源代码文件
-        for i in range(num_files):
-            file_content = []
-            for j in range(keys_per_file):
-                if i % 3 == 0:  # JavaScript
-                    file_content.append(f"const text{j} = t('section{i}.key{j}');")
-                elif i % 3 == 1:  # Vue
-                    file_content.append(f"<div>{{{{ $t('section{i}.key{j}') }}}}</div>")
-                else:  # Python
-                    file_content.append(f"text{j} = _('section{i}.key{j}')")
-
-            ext = ['.js', '.vue', '.py'][i % 3]
-            file_path = os.path.join(self.config.project_path, f'file{i}{ext}')
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(file_content))
-
-        # 创建大型国际化文件
-        large_i18n_data = {}
-        for i in range(num_files):
-            section_data = {}
-            for j in range(int(keys_per_file * 0.8)):  # 80%的键存在，20%缺失
-                section_data[f'key{j}'] = f'Value {i}-{j}'
-            large_i18n_data[f'section{i}'] = section_data
-
-        i18n_file = os.path.join(self.config.i18n_path, 'en.json')
-        with open(i18n_file, 'w', encoding='utf-8') as f:
-            json.dump(large_i18n_data, f, indent=2)
-
-        return num_files * keys_per_file, len(large_i18n_data)
+        """使用共享的大型测试项目，配置指向其源码和国际化目录（测试不得修改其中的文件）"""
+        project_path, i18n_path, totals = self.large_project(num_files, keys_per_file)
+        self.config.project_path = project_path
+        self.config.i18n_path = i18n_path
+        return totals
 
     def test_scanning_performance(self):
         """测试文件扫描性能"""
@@ -90,9 +153,7 @@ class TestPerformanceBenchmarks:
         assert files_per_second >= 50  # 降低要求到50文件/秒
 
         # 内存使用检查
-        import psutil
-        process = psutil.Process()
-        memory_mb = process.memory_info().rss / 1024 / 1024
+        memory_mb = _current_rss_mb()
         print(f"扫描内存使用: {memory_mb:.1f} MB")
         assert memory_mb < 200  # 内存使用应该小于200MB
 
@@ -108,8 +169,7 @@ class TestPerformanceBenchmarks:
                 large_data[f'section{i}'] = section_data
 
             file_path = os.path.join(self.config.i18n_path, f'{lang}.json')
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(large_data, f, indent=2)
+            _write_json(file_path, large_data)
 
         parser = I18nFileParser(self.config)
 
@@ -136,14 +196,16 @@ class TestPerformanceBenchmarks:
         num_files = 200
         keys_per_file = 100
 
+        # 键矩阵只生成一次，扫描结果和解析结果共用同一批驻留后的键字符串（与扫描器的行为一致）
+        key_grid = [[sys.intern(f'section{i}.key{j}') for j in range(keys_per_file)] for i in range(num_files)]
+
         # 模拟扫描结果
         i18n_calls = []
         unique_keys = set()
         for i in range(num_files):
-            for j in range(keys_per_file):
-                key = f'section{i}.key{j}'
+            for j, key in enumerate(key_grid[i]):
                 call = I18nCall(key=key, file_path=f'/project/file{i}.js', line_number=j, column_number=10,
-                    context=f't("section{i}.key{j}")')
+                    context=f't("{key}")')
                 i18n_calls.append(call)
                 unique_keys.add(key)
 
@@ -155,8 +217,8 @@ class TestPerformanceBenchmarks:
         # 模拟解析结果（80%的键存在）
         all_keys = {}
         for i in range(num_files):
-            for j in range(int(keys_per_file * 0.8)):
-                all_keys[f'section{i}.key{j}'] = f'Value {i}-{j}'
+            for j, key in enumerate(key_grid[i][:int(keys_per_file * 0.8)]):
+                all_keys[key] = f'Value {i}-{j}'
 
         file_info = I18nFileInfo(file_path='/i18n/en.json', relative_path='en.json', parser_type='json', file_size=1024,
             keys=set(all_keys.keys()), data=all_keys)
@@ -183,11 +245,8 @@ class TestPerformanceBenchmarks:
 
     def test_memory_efficiency(self):
         """测试内存效率"""
-        import psutil
-        process = psutil.Process()
-
         # 记录初始内存
-        initial_memory = process.memory_info().rss / 1024 / 1024
+        initial_memory = _current_rss_mb()
 
         # 创建大型项目
         self.create_large_project(1000, 50)
@@ -208,7 +267,7 @@ class TestPerformanceBenchmarks:
         analysis_result = analyzer.analyze(project_scan_result, parse_results)
 
         # 记录峰值内存
-        peak_memory = process.memory_info().rss / 1024 / 1024
+        peak_memory = _current_rss_mb()
         memory_increase = peak_memory - initial_memory
 
         print(f"内存增长: {memory_increase:.1f} MB")
@@ -221,7 +280,7 @@ class TestPerformanceBenchmarks:
         import gc
         gc.collect()
 
-        final_memory = process.memory_info().rss / 1024 / 1024
+        final_memory = _current_rss_mb()
         memory_released = peak_memory - final_memory
 
         print(f"内存释放: {memory_released:.1f} MB")
@@ -263,9 +322,9 @@ class TestPerformanceBenchmarks:
         """测试大文件处理"""
         # 创建一个非常大的文件
         large_file = os.path.join(self.config.project_path, 'large_file.js')
-        with open(large_file, 'w', encoding='utf-8') as f:
-            for i in range(10000):  # 10000行
-                f.write(f"const text{i} = t('large.key{i}');\n")
+        with open(large_file, 'wb') as f:
+            # 10000行，拼接后一次写入
+            f.write(''.join(f"const text{i} = t('large.key{i}');\n" for i in range(10000)).encode('utf-8'))
 
         scanner = FileScanner(self.config)
 
@@ -342,145 +401,134 @@ class TestPerformanceBenchmarks:
         print(f"报告生成: {items_per_second:.0f} 项/秒")
         assert items_per_second >= 500  # 每秒至少500项
 
-    def teardown_method(self):
-        """测试后清理"""
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
-
 
 class TestMemoryLeakDetection:
     """内存泄漏检测测试"""
 
-    def test_repeated_analysis_memory_stability(self):
+    def test_repeated_analysis_memory_stability(self, tmp_path):
         """测试重复分析的内存稳定性"""
-        import psutil
         import gc
+        import tracemalloc
+        from src.core.scanner import ProjectScanResult
 
-        process = psutil.Process()
-        temp_dir = tempfile.mkdtemp()
+        temp_dir = str(tmp_path)
+        # 只统计项目源码中分配的内存，避免进程堆和小对象分配器的波动造成误报
+        src_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src') + os.sep
 
-        try:
-            # 设置配置
-            config = Config()
-            config.project_path = os.path.join(temp_dir, 'project')
-            config.i18n_path = os.path.join(temp_dir, 'i18n')
+        # 设置配置
+        config = Config()
+        config.project_path = os.path.join(temp_dir, 'project')
+        config.i18n_path = os.path.join(temp_dir, 'i18n')
 
-            os.makedirs(config.project_path)
-            os.makedirs(config.i18n_path)
+        os.makedirs(config.project_path)
+        os.makedirs(config.i18n_path)
 
-            # 创建测试文件
-            test_file = os.path.join(config.project_path, 'test.js')
-            with open(test_file, 'w') as f:
-                f.write("const text = t('test.key');")
+        # 创建测试文件
+        test_file = os.path.join(config.project_path, 'test.js')
+        with open(test_file, 'w') as f:
+            f.write("const text = t('test.key');")
 
-            i18n_file = os.path.join(config.i18n_path, 'en.json')
-            with open(i18n_file, 'w') as f:
-                json.dump({'test': {'key': 'value'}}, f)
+        i18n_file = os.path.join(config.i18n_path, 'en.json')
+        with open(i18n_file, 'w') as f:
+            json.dump({'test': {'key': 'value'}}, f)
 
-            memory_readings = []
+        def run_analysis():
+            scanner = FileScanner(config)
+            summary = scanner.scan_project()
+            scan_results = scanner.get_results()
 
-            # 执行多次分析
-            for i in range(10):
-                scanner = FileScanner(config)
-                summary = scanner.scan_project()
-                scan_results = scanner.get_results()
+            project_scan_result = ProjectScanResult.from_summary_and_results(summary, scan_results)
 
-                # 创建ProjectScanResult
-                from src.core.scanner import ProjectScanResult
-                project_scan_result = ProjectScanResult.from_summary_and_results(summary, scan_results)
+            parser = I18nFileParser(config)
+            parse_results = parser.parse_directory()
 
-                parser = I18nFileParser(config)
-                parse_results = parser.parse_directory()
+            analyzer = AnalysisEngine()
+            analyzer.analyze(project_scan_result, parse_results)
 
-                analyzer = AnalysisEngine()
-                analysis_result = analyzer.analyze(project_scan_result, parse_results)
+        # 预热一次，让正则编译、解析器实例等模块级缓存先建立起来
+        run_analysis()
+        gc.collect()
 
-                # 清理对象
-                del scanner, parser, analyzer, scan_results, project_scan_result, parse_results, analysis_result
-                gc.collect()
+        tracemalloc.start(25)
+        try:
+            snapshot_before = tracemalloc.take_snapshot()
 
-                # 记录内存使用
-                memory_mb = process.memory_info().rss / 1024 / 1024
-                memory_readings.append(memory_mb)
+            # 执行多次分析
+            for i in range(10):
+                run_analysis()
+            gc.collect()
 
-            # 检查内存增长趋势
-            memory_growth = memory_readings[-1] - memory_readings[0]
-            print(f"10次分析内存增长: {memory_growth:.1f} MB")
+            snapshot_after = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
 
-            # 内存增长应该很小（小于10MB）
-            assert memory_growth < 10
+        # 按源码行归因内存增长
+        leaked = sum(stat.size_diff for stat in snapshot_after.compare_to(snapshot_before, 'lineno')
+                     if stat.traceback[0].filename.startswith(src_dir))
+        print(f"10次分析源码内存增长: {leaked / 1024:.1f} KB")
 
-        finally:
-            shutil.rmtree(temp_dir)
+        # 内存增长应该很小（小于1MB）
+        assert leaked < 1_000_000
 
 
 class TestScalabilityLimits:
     """可扩展性极限测试"""
 
-    def test_maximum_file_count(self):
+    def test_maximum_file_count(self, tmp_path):
         """测试最大文件数量处理能力"""
-        temp_dir = tempfile.mkdtemp()
+        temp_dir = str(tmp_path)
 
-        try:
-            config = Config()
-            config.project_path = os.path.join(temp_dir, 'project')
-            os.makedirs(config.project_path)
+        config = Config()
+        config.project_path = os.path.join(temp_dir, 'project')
+        os.makedirs(config.project_path)
 
-            # 创建大量小文件
-            max_files = 5000
-            for i in range(max_files):
-                file_path = os.path.join(config.project_path, f'file{i}.js')
-                with open(file_path, 'w') as f:
-                    f.write(f"const text = t('file{i}.key');")
+        # 创建大量小文件
+        max_files = 5000
+        for i in range(max_files):
+            file_path = os.path.join(config.project_path, f'file{i}.js')
+            with open(file_path, 'wb') as f:
+                f.write(f"const text = t('file{i}.key');".encode('utf-8'))
 
-            scanner = FileScanner(config)
-
-            start_time = time.time()
-            summary = scanner.scan_project()
-            results = scanner.get_results()
-            process_time = time.time() - start_time
+        scanner = FileScanner(config)
 
-            assert len(results) == max_files
-            print(f"处理{max_files}个文件耗时: {process_time:.2f}秒")
+        start_time = time.time()
+        summary = scanner.scan_project()
+        results = scanner.get_results()
+        process_time = time.time() - start_time
 
-            # 应该在合理时间内完成
-            assert process_time < 60  # 1分钟内完成
+        assert len(results) == max_files
+        print(f"处理{max_files}个文件耗时: {process_time:.2f}秒")
 
-        finally:
-            shutil.rmtree(temp_dir)
+        # 应该在合理时间内完成
+        assert process_time < 60  # 1分钟内完成
 
-    def test_maximum_key_count(self):
+    def test_maximum_key_count(self, tmp_path):
         """测试最大键数量处理能力"""
-        temp_dir = tempfile.mkdtemp()
+        temp_dir = str(tmp_path)
 
-        try:
-            config = Config()
-            config.i18n_path = os.path.join(temp_dir, 'i18n')
-            os.makedirs(config.i18n_path)
+        config = Config()
+        config.i18n_path = os.path.join(temp_dir, 'i18n')
+        os.makedirs(config.i18n_path)
 
-            # 创建包含大量键的国际化文件
-            max_keys = 50000
-            large_data = {}
-            for i in range(max_keys):
-                large_data[f'key{i}'] = f'Value {i}'
+        # 创建包含大量键的国际化文件
+        max_keys = 50000
+        large_data = {}
+        for i in range(max_keys):
+            large_data[f'key{i}'] = f'Value {i}'
 
-            i18n_file = os.path.join(config.i18n_path, 'large.json')
-            with open(i18n_file, 'w') as f:
-                json.dump(large_data, f)
+        i18n_file = os.path.join(config.i18n_path, 'large.json')
+        _write_json(i18n_file, large_data)
 
-            parser = I18nFileParser(config)
-
-            start_time = time.time()
-            results = parser.parse_directory()
-            process_time = time.time() - start_time
+        parser = I18nFileParser(config)
 
-            assert len(results.files) == 1
-            assert len(results.total_keys) == max_keys
+        start_time = time.time()
+        results = parser.parse_directory()
+        process_time = time.time() - start_time
 
-            print(f"解析{max_keys}个键耗时: {process_time:.2f}秒")
+        assert len(results.files) == 1
+        assert len(results.total_keys) == max_keys
 
-            # 应该在合理时间内完成
-            assert process_time < 30  # 30秒内完成
+        print(f"解析{max_keys}个键耗时: {process_time:.2f}秒")
 
-        finally:
-            shutil.rmtree(temp_dir)
+        # 应该在合理时间内完成
+        assert process_time < 30  # 30秒内完成
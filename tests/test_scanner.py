@@ -7,6 +7,7 @@ import tempfile
 import pytest
 from unittest.mock import patch, MagicMock
 
+from src.core import scanner as scanner_module
 from src.core.scanner import FileScanner, ScanResult, I18nCall, ProjectScanResult
 from src.core.config import Config
 
@@ -151,6 +152,33 @@ class TestFileScanner:
         # 验证回调被调用
         assert len(callback_calls) > 0
     
+    def test_process_pool_scan_matches_sequential(self, monkeypatch):
+        """测试多进程扫描的结果与单线程扫描一致"""
+        for i in range(6):
+            with open(os.path.join(self.temp_dir, f'file{i}.js'), 'w', encoding='utf-8') as f:
+                f.write(f"t('shared.key')\n$t('file{i}.key')\nt(`dynamic.${{id}}`)")
+
+        self.config.project_path = self.temp_dir
+        self.config.max_threads = 1
+        sequential = FileScanner(self.config)
+        sequential_summary = sequential.scan_project()
+
+        monkeypatch.setattr(scanner_module, '_PROCESS_POOL_MIN_FILES', 1)
+        monkeypatch.setattr(os, 'cpu_count', lambda: 2)
+        self.config.max_threads = 2
+        pooled = FileScanner(self.config)
+        with patch.object(pooled, '_scan_files_threaded') as threaded:
+            pooled_summary = pooled.scan_project()
+        threaded.assert_not_called()
+
+        assert pooled_summary.unique_keys == sequential_summary.unique_keys
+        assert pooled.get_results() == sequential.get_results()
+
+        # 子进程返回的键重新驻留
+        keys = [match['key'] for result in pooled.get_results() for match in result.matches
+                if match['key'] == 'shared.key']
+        assert len(keys) == 6 and all(key is keys[0] for key in keys)
+
     def test_stop_scan(self):
         """测试停止扫描"""
         # 这个测试比较复杂，因为需要模拟长时间运行的扫描
@@ -170,6 +198,21 @@ class TestFileScanner:
         
         assert '中文.键名' in summary.unique_keys
     
+    def test_large_file_with_crlf(self):
+        """测试大文件（mmap读取路径）的换行符处理与小文件一致"""
+        filler = "// " + "x" * 100 + "\r\n"
+        content = filler * 1000 + "const title = t('large.file.key');\r\n"
+        test_file = os.path.join(self.temp_dir, 'large.js')
+        with open(test_file, 'w', encoding='utf-8', newline='') as f:
+            f.write(content)
+
+        result = self.scanner._scan_single_file(test_file)
+
+        assert result.error is None
+        assert [match['key'] for match in result.matches] == ['large.file.key']
+        assert result.matches[0]['line'] == 1001
+        assert result.matches[0]['column'] == 15
+
     def test_multiple_file_extensions(self):
         """测试多种文件扩展名"""
         # 创建不同类型的文件
@@ -223,6 +266,14 @@ class TestI18nCall:
         assert call.pattern == 't()'
         assert call.context == 'const title = t("test.key");'
 
+    def test_i18n_call_key_interned(self):
+        """测试相同的键共享同一个字符串对象"""
+        key = ''.join(['common.', 'title'])
+        first = I18nCall(key=key, file_path='a.js', line_number=1, column_number=1)
+        second = I18nCall(key='common.' + 'title', file_path='b.js', line_number=1, column_number=1)
+
+        assert first.key is second.key
+
 
 class TestScanResult:
     """ScanResult数据结构测试"""